@@ -11,24 +11,68 @@ from dotenv import load_dotenv
 _env_path = Path(__file__).resolve().parent / ".env"
 load_dotenv(_env_path)
 
-import json
+import asyncio
+import importlib.util
 import os
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
-from fastapi import FastAPI, HTTPException
+import httpx
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-app = FastAPI(title="Investment Data Collector", version="1.0")
+from collectors import http_client, json_codec
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 응답 직렬화 (/us-daily OHLCV 배열 등 대량 응답의 인코딩 비용 절감)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
+
+
+app = FastAPI(title="Investment Data Collector", version="1.0", default_response_class=FastJSONResponse)
 
 # 컨테이너 내: /app/collector.py / 로컬: collectors/us_daily_collector.py
 COLLECTOR_SCRIPT = Path("/app/collector.py") if Path("/app/collector.py").exists() else Path(__file__).resolve().parent / "collectors" / "us_daily_collector.py"
 
+# 1이면 레거시 경로: /us-daily 요청마다 collector 스크립트를 subprocess로 실행
+# (기본: 기동 시 1회 import 후 프로세스 내에서 fetch_us_daily 직접 호출)
+US_DAILY_SUBPROCESS = os.environ.get("US_DAILY_SUBPROCESS", "").strip() == "1"
+_collector_module = None
+
+# collector 상태: 기동 시 1회 확인 후 COLLECTOR_PROBE_INTERVAL_SEC 주기로 재확인.
+# 비정상이면 /us-daily 는 수집을 시도하지 않고 즉시 503 (subprocess 타임아웃 120초 대기 방지)
+COLLECTOR_PROBE_INTERVAL_SEC = 60
+_COLLECTOR_OK = False
+_probe_task: asyncio.Task | None = None
+
+# 블로킹 수집 함수(asyncio.to_thread) 실행용 기본 executor 스레드 수 상한
+BLOCKING_WORKERS = 8
+
 # DART/SEC 스케줄 사용 여부 (1이면 기동 시 10분/15분 주기로 수집)
 SCHEDULE_DART_SEC = os.environ.get("SCHEDULE_DART_SEC", "").strip() == "1"
 
+# Spring 전송용 공유 클라이언트 (startup에서 생성, shutdown에서 종료 → keep-alive 커넥션 재사용)
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = http_client.new_async_client(timeout=60)
+    return _http_client
+
 
-def _post_collected_news(items: list[dict]) -> dict:
+async def _aiter_items_payload(items: list[dict]):
+    """json_codec.iter_items_payload의 async iterable 버전 (AsyncClient는 동기 iterator 본문을 받지 않음)."""
+    for chunk in json_codec.iter_items_payload(items):
+        yield chunk
+
+
+async def _post_collected_news(items: list[dict]) -> dict:
     """Spring 내부 API로 수집 항목 전송. 응답 { received, saved } 반환."""
     internal_key = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
     spring_url = os.environ.get("SPRING_BASE_URL", "http://localhost:8080").rstrip("/")
@@ -36,44 +80,114 @@ def _post_collected_news(items: list[dict]) -> dict:
         raise HTTPException(status_code=503, detail="DATA_COLLECTION_INTERNAL_KEY not set")
     if not items:
         return {"received": 0, "saved": 0}
-    import urllib.request
     url = f"{spring_url}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json", "X-Internal-Data-Key": internal_key},
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
+        resp = await _get_http_client().post(
+            url,
+            content=_aiter_items_payload(items),
+            headers={"Content-Type": "application/json", "X-Internal-Data-Key": internal_key},
+        )
+        resp.raise_for_status()
+        return json_codec.loads(resp.content)
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Spring API error: {e}")
 
 
-def run_collector(bas_dt: str, symbols: list[str]) -> list[dict]:
-    if not COLLECTOR_SCRIPT.exists():
-        raise RuntimeError("collector script not found")
-    symbols_str = ",".join(s for s in symbols if s and str(s).strip())
-    if not symbols_str:
-        return []
+def _load_collector():
+    """collector 스크립트를 모듈로 1회 로드 (yfinance 등 import 비용을 요청마다 내지 않도록)."""
+    global _collector_module
+    if _collector_module is None:
+        spec = importlib.util.spec_from_file_location("us_daily_collector", COLLECTOR_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _collector_module = module
+    return _collector_module
+
+
+async def _run_collector_subprocess(bas_dt: str, symbols_str: str) -> list[dict]:
     try:
-        proc = subprocess.run(
-            [sys.executable, str(COLLECTOR_SCRIPT), "--bas-dt", bas_dt, "--symbols", symbols_str],
-            capture_output=True,
-            text=True,
-            timeout=120,
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, str(COLLECTOR_SCRIPT), "--bas-dt", bas_dt, "--symbols", symbols_str,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=str(COLLECTOR_SCRIPT.parent),
         )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=120)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
         if proc.returncode != 0:
             return []
-        out = (proc.stdout or "").strip()
+        out = (stdout or b"").strip()
         if not out:
             return []
-        return json.loads(out)
-    except (json.JSONDecodeError, subprocess.TimeoutExpired, FileNotFoundError) as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return json_codec.loads(out)
+    except (json_codec.JSONDecodeError, asyncio.TimeoutError, FileNotFoundError) as e:
+        raise HTTPException(status_code=500, detail=str(e) or type(e).__name__)
+
+
+async def _probe_collector() -> bool:
+    """collector 사용 가능 여부 (스크립트 존재 + yfinance import).
+    subprocess 모드는 실제 실행 경로와 같게 --self-check 로 자식 프로세스에서 확인.
+    """
+    if not COLLECTOR_SCRIPT.exists():
+        return False
+    if US_DAILY_SUBPROCESS:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, str(COLLECTOR_SCRIPT), "--self-check",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=str(COLLECTOR_SCRIPT.parent),
+            )
+        except OSError:
+            return False
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False
+        return proc.returncode == 0
+    try:
+        collector = await asyncio.to_thread(_load_collector)
+        return await asyncio.to_thread(collector.self_check)
+    except Exception as e:
+        print(f"US 일봉 collector 로드 실패: {e}", file=sys.stderr)
+        return False
+
+
+async def _refresh_collector_health() -> None:
+    global _COLLECTOR_OK
+    ok = await _probe_collector()
+    if ok != _COLLECTOR_OK:
+        print(f"US 일봉 collector 상태: {'정상' if ok else '사용 불가'}", file=sys.stderr)
+    _COLLECTOR_OK = ok
+
+
+async def _probe_collector_loop() -> None:
+    while True:
+        await asyncio.sleep(COLLECTOR_PROBE_INTERVAL_SEC)
+        await _refresh_collector_health()
+
+
+async def run_collector(bas_dt: str, symbols: list[str]) -> list[dict]:
+    if not _COLLECTOR_OK:
+        raise HTTPException(status_code=503, detail="collector unavailable")
+    symbols = [str(s).strip() for s in symbols if s and str(s).strip()]
+    if not symbols:
+        return []
+    if US_DAILY_SUBPROCESS:
+        return await _run_collector_subprocess(bas_dt, ",".join(symbols))
+    collector = _load_collector()
+    try:
+        return await asyncio.to_thread(collector.fetch_us_daily, bas_dt, symbols)
+    except ValueError as e:
+        # 잘못된 bas_dt 등: subprocess 경로(비정상 종료 → [])와 동일하게 빈 결과
+        print(f"US 일봉 수집 오류: {e}", file=sys.stderr)
+        return []
 
 
 class UsDailyRequest(BaseModel):
@@ -82,149 +196,183 @@ class UsDailyRequest(BaseModel):
 
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    return {"status": "ok", "collector": "ok" if _COLLECTOR_OK else "unavailable"}
 
 
 @app.post("/us-daily")
-def us_daily(req: UsDailyRequest):
+async def us_daily(req: UsDailyRequest):
     """기준일 US 종목 OHLCV 수집. Spring이 이 JSON 배열을 파싱해 DB 저장."""
-    rows = run_collector(req.bas_dt, req.symbols)
+    rows = await run_collector(req.bas_dt, req.symbols)
+    return rows
+
+
+@app.get("/us-daily")
+async def us_daily_get(
+    bas_dt: str = Query(..., alias="bas-dt", description="기준일 YYYY-MM-DD"),
+    symbols: str = Query(..., description="쉼표 구분 종목 코드"),
+):
+    """POST /us-daily 의 쿼리 파라미터 버전 (예: /us-daily?bas-dt=2026-01-30&symbols=SPY,QQQ).
+    collector CLI와 같은 인자 형식이라 스크립트 호출을 HTTP 호출로 바로 대체 가능.
+    """
+    rows = await run_collector(bas_dt, symbols.split(","))
     return rows
 
 
 @app.post("/dart-collect")
-def dart_collect():
+async def dart_collect():
     """DART 공시 수집 후 Spring 내부 API로 전송. (배치 역할: Python에서 수행)"""
     if not os.environ.get("DART_API_KEY", "").strip():
         return {"received": 0, "saved": 0, "reason": "DART_API_KEY not set"}
-    from collectors.dart_collector import fetch_dart_for_days, to_collected_items
-    raw = fetch_dart_for_days()
+    from collectors.dart_collector import fetch_dart_for_days, save_dart_last_seen, to_collected_items
+    raw, complete = await asyncio.to_thread(fetch_dart_for_days)
     items = to_collected_items(raw)
-    result = _post_collected_news(items)
+    result = await _post_collected_news(items)
+    if complete:
+        save_dart_last_seen(items)
     return result
 
 
 @app.post("/sec-collect")
-def sec_collect():
+async def sec_collect():
     """SEC EDGAR 공시 수집 후 Spring 내부 API로 전송. (배치 역할: Python에서 수행). data.sec.gov는 API 키 없이 User-Agent만으로 조회 가능."""
-    from collectors.sec_edgar_collector import fetch_sec_recent_filings
-    items = fetch_sec_recent_filings()
-    result = _post_collected_news(items)
+    from collectors.sec_edgar_collector import fetch_sec_recent_filings, save_sec_validators
+    items, validators = await fetch_sec_recent_filings()
+    result = await _post_collected_news(items)
+    save_sec_validators(validators)
     return result
 
 
 @app.post("/yonhap-collect")
-def yonhap_collect():
+async def yonhap_collect():
     """연합뉴스 RSS 수집 후 Spring 내부 API로 전송. (Speed 계층)"""
     from collectors.yonhap_collector import fetch_yonhap_news
-    items = fetch_yonhap_news()
-    result = _post_collected_news(items)
+    items = await fetch_yonhap_news()
+    result = await _post_collected_news(items)
     return result
 
 
 @app.post("/naver-collect")
-def naver_collect():
+async def naver_collect():
     """네이버 금융 뉴스 수집 후 Spring 내부 API로 전송. (Buzz 계층)"""
-    from collectors.naver_collector import fetch_naver_news
-    items = fetch_naver_news()
-    result = _post_collected_news(items)
+    from collectors.naver_collector import fetch_naver_news, mark_forwarded
+    items = await asyncio.to_thread(fetch_naver_news)
+    result = await _post_collected_news(items)
+    mark_forwarded(items)
     return result
 
 
 @app.post("/google-news-collect")
-def google_news_collect():
+async def google_news_collect():
     """Google News RSS 수집 후 Spring 내부 API로 전송. (Speed 계층 - Reuters 대안)"""
-    from collectors.google_news_collector import fetch_google_news
-    items = fetch_google_news()
-    result = _post_collected_news(items)
+    from collectors.google_news_collector import fetch_google_news, mark_forwarded
+    items = await fetch_google_news()
+    result = await _post_collected_news(items)
+    mark_forwarded(items)
     return result
 
 
 # ----- 스케줄러 (SCHEDULE_DART_SEC=1 일 때만) -----
+# AsyncIOScheduler: 잡이 앱 이벤트 루프에서 실행되어 공유 httpx.AsyncClient를 그대로 사용.
 _scheduler = None
 
 # Speed/Buzz 스케줄 활성화 여부 (SCHEDULE_SPEED_BUZZ=1)
 SCHEDULE_SPEED_BUZZ = os.environ.get("SCHEDULE_SPEED_BUZZ", "").strip() == "1"
 
 
-def _run_dart_job():
+async def _run_dart_job():
     try:
-        from collectors.dart_collector import fetch_dart_for_days, to_collected_items
-        raw = fetch_dart_for_days()
+        from collectors.dart_collector import fetch_dart_for_days, save_dart_last_seen, to_collected_items
+        raw, complete = await asyncio.to_thread(fetch_dart_for_days)
         items = to_collected_items(raw)
         if items:
-            _post_collected_news(items)
+            await _post_collected_news(items)
+            if complete:
+                save_dart_last_seen(items)
     except Exception as e:
         print(f"DART 스케줄 실행 오류: {e}", file=sys.stderr)
 
 
-def _run_sec_job():
+async def _run_sec_job():
     try:
-        from collectors.sec_edgar_collector import fetch_sec_recent_filings
-        items = fetch_sec_recent_filings()
+        from collectors.sec_edgar_collector import fetch_sec_recent_filings, save_sec_validators
+        items, validators = await fetch_sec_recent_filings()
         if items:
-            _post_collected_news(items)
+            await _post_collected_news(items)
+        save_sec_validators(validators)
     except Exception as e:
         print(f"SEC 스케줄 실행 오류: {e}", file=sys.stderr)
 
 
-def _run_yonhap_job():
+async def _run_yonhap_job():
     """연합뉴스 RSS 수집 (Speed 계층)"""
     try:
         from collectors.yonhap_collector import fetch_yonhap_news
-        items = fetch_yonhap_news()
+        items = await fetch_yonhap_news()
         if items:
-            _post_collected_news(items)
+            await _post_collected_news(items)
     except Exception as e:
         print(f"연합뉴스 스케줄 실행 오류: {e}", file=sys.stderr)
 
 
-def _run_naver_job():
+async def _run_naver_job():
     """네이버 금융 뉴스 수집 (Buzz 계층)"""
     try:
-        from collectors.naver_collector import fetch_naver_news
-        items = fetch_naver_news()
+        from collectors.naver_collector import fetch_naver_news, mark_forwarded
+        items = await asyncio.to_thread(fetch_naver_news)
         if items:
-            _post_collected_news(items)
+            await _post_collected_news(items)
+            mark_forwarded(items)
     except Exception as e:
         print(f"네이버 금융 스케줄 실행 오류: {e}", file=sys.stderr)
 
 
-def _run_google_news_job():
+async def _run_google_news_job():
     """Google News RSS 수집 (Speed 계층)"""
     try:
-        from collectors.google_news_collector import fetch_google_news
-        items = fetch_google_news()
+        from collectors.google_news_collector import fetch_google_news, mark_forwarded
+        items = await fetch_google_news()
         if items:
-            _post_collected_news(items)
+            await _post_collected_news(items)
+            mark_forwarded(items)
     except Exception as e:
         print(f"Google News 스케줄 실행 오류: {e}", file=sys.stderr)
 
 
 @app.on_event("startup")
-def startup():
-    global _scheduler
-    
+async def startup():
+    global _scheduler, _probe_task
+
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="collector")
+    )
+    _get_http_client()
+    await _refresh_collector_health()
+    _probe_task = asyncio.create_task(_probe_collector_loop())
+
     if not SCHEDULE_DART_SEC and not SCHEDULE_SPEED_BUZZ:
         return
     
     try:
-        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
         from apscheduler.triggers.interval import IntervalTrigger
         
-        _scheduler = BackgroundScheduler(timezone="Asia/Seoul")
+        _scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+        
+        # jitter: 레플리카 간 동시 발화 방지 (매 실행 ±jitter초 무작위 이동)
+        # coalesce/max_instances: 느린 실행이 겹쳐 쌓이지 않도록 1개만 유지
+        job_opts = {"coalesce": True, "max_instances": 1}
         
         if SCHEDULE_DART_SEC:
-            _scheduler.add_job(_run_dart_job, IntervalTrigger(minutes=10), id="dart")
-            _scheduler.add_job(_run_sec_job, IntervalTrigger(minutes=15), id="sec")
-            print("DART/SEC 스케줄러 등록: DART 10분, SEC 15분 주기", file=sys.stderr)
+            _scheduler.add_job(_run_dart_job, IntervalTrigger(minutes=10, jitter=120), id="dart", **job_opts)
+            _scheduler.add_job(_run_sec_job, IntervalTrigger(minutes=15, jitter=180), id="sec", **job_opts)
+            print("DART/SEC 스케줄러 등록: DART 10분(±2분), SEC 15분(±3분) 주기", file=sys.stderr)
         
         if SCHEDULE_SPEED_BUZZ:
-            _scheduler.add_job(_run_yonhap_job, IntervalTrigger(minutes=5), id="yonhap")
-            _scheduler.add_job(_run_naver_job, IntervalTrigger(minutes=10), id="naver")
-            _scheduler.add_job(_run_google_news_job, IntervalTrigger(minutes=5), id="google_news")
-            print("Speed/Buzz 스케줄러 등록: 연합뉴스 5분, 네이버 10분, Google News 5분 주기", file=sys.stderr)
+            _scheduler.add_job(_run_yonhap_job, IntervalTrigger(minutes=5, jitter=60), id="yonhap", **job_opts)
+            _scheduler.add_job(_run_naver_job, IntervalTrigger(minutes=10, jitter=120), id="naver", **job_opts)
+            _scheduler.add_job(_run_google_news_job, IntervalTrigger(minutes=5, jitter=60), id="google_news", **job_opts)
+            print("Speed/Buzz 스케줄러 등록: 연합뉴스 5분(±1분), 네이버 10분(±2분), Google News 5분(±1분) 주기", file=sys.stderr)
         
         _scheduler.start()
         print("스케줄러 시작 완료", file=sys.stderr)
@@ -233,8 +381,18 @@ def startup():
 
 
 @app.on_event("shutdown")
-def shutdown():
-    global _scheduler
+async def shutdown():
+    global _scheduler, _http_client, _probe_task
+    if _probe_task is not None:
+        _probe_task.cancel()
+        _probe_task = None
     if _scheduler:
         _scheduler.shutdown(wait=False)
         _scheduler = None
+    from collectors import google_news_collector, naver_collector
+    google_news_collector.shutdown_parse_pool()
+    google_news_collector.save_seen_urls()
+    naver_collector.save_seen_urls()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
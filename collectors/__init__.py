@@ -6,3 +6,8 @@
 # - Yonhap: 연합뉴스 RSS (Speed 계층)
 # - Naver: 네이버 금융 뉴스 (Buzz 계층)
 # - Google News: Google News RSS (Speed 계층 - Reuters 대안)
+# - file_cache: 디스크 TTL 캐시·원자적 파일 쓰기 (공통)
+# - keyword_matcher: 시그널 키워드 다중 패턴 매칭 (Aho-Corasick, 공통)
+# - json_codec: orjson 기반 JSON dumps/loads (미설치 시 표준 json, 공통)
+# - dedup: 정규화 URL 64비트 해시 키 (xxh3) · 전송 완료 URL LRU (공통)
+# - http_client: 공통 httpx 커넥션 풀·GET 재시도 (공통)
@@ -7,18 +7,32 @@ Open DART 공시 목록 수집 (list.json API)
   DART_API_KEY: Open DART API 인증키 (필수)
   DART_BASE_URL: 기본 https://opendart.fss.or.kr/api
   DART_COLLECT_DAYS: 수집 기간(일). 기본 3
+  DART_CACHE_DIR: list.json 페이지 캐시 디렉터리. 기본 <프로젝트>/.cache/dart
+  DART_CACHE_TTL_SEC: 페이지 캐시 TTL(초). 기본 600 (스케줄 주기 10분과 동일)
+  COLLECTOR_STATE_DIR: 마지막 전송 접수일(dart_last_seen) 저장 디렉터리. 기본 <프로젝트>/.state
   SPRING_BASE_URL: Spring 서버 URL (예: http://localhost:8080)
   DATA_COLLECTION_INTERNAL_KEY: Spring investment.data.internal-api-key 와 동일
 """
-import json
 import logging
 import os
 import sys
-import urllib.request
-import urllib.error
 import urllib.parse
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
+
+try:
+    from collectors import http_client, json_codec
+    from collectors.file_cache import STATE_DIR, FileCache, atomic_write_text
+    from collectors.keyword_matcher import KeywordMatcher
+except ImportError:  # 스크립트 직접 실행 (python collectors/dart_collector.py)
+    import http_client
+    import json_codec
+    from file_cache import STATE_DIR, FileCache, atomic_write_text
+    from keyword_matcher import KeywordMatcher
 
 DART_BASE_URL = os.environ.get("DART_BASE_URL", "https://opendart.fss.or.kr/api").rstrip("/")
 DART_API_KEY = os.environ.get("DART_API_KEY", "")
@@ -27,6 +41,25 @@ SPRING_BASE_URL = os.environ.get("SPRING_BASE_URL", "http://localhost:8080")
 INTERNAL_KEY = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
 
 MAX_PAGE_COUNT = 100
+# list.json status: 조회된 데이터 없음 (오류 아님)
+DART_STATUS_NO_DATA = "013"
+# 2페이지 이후 동시 조회 워커 수
+DART_FETCH_WORKERS = 4
+# 워커 수와 무관하게 DART OpenAPI 초당 요청 수 상한 유지
+DART_MAX_REQUESTS_PER_SEC = 5
+
+DART_CACHE_DIR = os.environ.get("DART_CACHE_DIR") or str(
+    Path(__file__).resolve().parent.parent / ".cache" / "dart"
+)
+DART_CACHE_TTL_SEC = int(os.environ.get("DART_CACHE_TTL_SEC", "600"))
+_page_cache = FileCache(DART_CACHE_DIR, ttl=DART_CACHE_TTL_SEC)
+
+# Spring으로 전송 완료한 항목의 최신 접수일(YYYY-MM-DD). 다음 실행은 이 날짜부터만 조회
+DART_LAST_SEEN_FILE = STATE_DIR / "dart_last_seen"
+
+# 모듈 단위 커넥션 풀 (페이지 동시 조회 워커들과 Spring 전송이 keep-alive 커넥션 공유)
+_CLIENT = http_client.new_client(timeout=30, follow_redirects=True)
+_RATE_LIMITER = http_client.RateLimiter(DART_MAX_REQUESTS_PER_SEC)
 
 _logger = logging.getLogger(__name__)
 
@@ -45,21 +78,15 @@ DART_SIGNAL_KEYWORDS = [
     "인수",
 ]
 
+_SIGNAL_MATCHER = KeywordMatcher(DART_SIGNAL_KEYWORDS)
+
 # 백엔드 필터용 eventType 접두사 (시그널 반영 대상 표시)
 DART_SIGNAL_EVENT_TYPE_PREFIX = "DART_SIGNAL:"
 
 
 def _matches_signal_keyword(text: Optional[str]) -> bool:
     """제목/보고서명에 시그널 키워드가 포함되면 True."""
-    if not text or not isinstance(text, str):
-        return False
-    t = text.strip()
-    if not t:
-        return False
-    for kw in DART_SIGNAL_KEYWORDS:
-        if kw in t:
-            return True
-    return False
+    return _SIGNAL_MATCHER.matches(text)
 
 
 def _build_viewer_url(rcept_no: Optional[str]) -> str:
@@ -68,20 +95,33 @@ def _build_viewer_url(rcept_no: Optional[str]) -> str:
     return f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
 
 
-def _parse_rcept_dt(rcept_dt: Optional[str]) -> str:
+def _parse_rcept_dt(rcept_dt: Optional[str], now_iso: Optional[str] = None) -> str:
+    """rcept_dt(YYYYMMDD) → ISO. 고정 형식이므로 strptime 없이 문자열 슬라이스로 변환.
+    실제 존재하는 날짜인지는 date()로 검증 (20240231 등 불가). 변환 불가 시 now_iso (호출 측에서 실행당 1회 계산해 전달).
+    """
+    if now_iso is None:
+        now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     if not rcept_dt or len(rcept_dt) < 8:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
+    ymd = rcept_dt[:8]
+    if not ymd.isdigit():
+        return now_iso
     try:
-        d = datetime.strptime(rcept_dt[:8], "%Y%m%d")
-        return d.strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{date(int(ymd[:4]), int(ymd[4:6]), int(ymd[6:8])).isoformat()}T00:00:00"
     except ValueError:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
 
 
-def fetch_dart_list(bgn_de: str, end_de: str, page_no: int) -> List[Dict[str, Any]]:
-    """DART list.json 한 페이지 조회. 성공 시 list 항목 반환."""
+def _fetch_dart_page(bgn_de: str, end_de: str, page_no: int) -> Optional[Dict[str, Any]]:
+    """DART list.json 한 페이지 응답 조회. TTL 캐시 적중 시 API 호출 생략.
+    status 000은 캐시 후 반환, 013(조회 데이터 없음)은 빈 페이지, 호출 실패·그 외 status는 None.
+    """
     if not DART_API_KEY or not DART_API_KEY.strip():
-        return []
+        return None
+    cache_key = f"{bgn_de}_{end_de}_{page_no}"
+    cached = _page_cache.get(cache_key)
+    if cached is not None:
+        return cached
     url = (
         f"{DART_BASE_URL}/list.json"
         f"?crtfc_key={urllib.parse.quote(DART_API_KEY)}"
@@ -89,68 +129,149 @@ def fetch_dart_list(bgn_de: str, end_de: str, page_no: int) -> List[Dict[str, An
         f"&page_no={page_no}&page_count={MAX_PAGE_COUNT}"
     )
     try:
-        with urllib.request.urlopen(url, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
-            if data.get("status") != "000":
-                return []
-            lst = data.get("list")
-            return lst if isinstance(lst, list) else []
+        resp = http_client.get_with_retry(_CLIENT, url, limiter=_RATE_LIMITER)
+        resp.raise_for_status()
+        data = json_codec.loads(resp.content)
     except Exception as e:
         print(f"DART API 호출 실패: {e}", file=sys.stderr)
-        return []
+        return None
+    status = data.get("status")
+    if status == DART_STATUS_NO_DATA:
+        return {"list": [], "total_page": 0}
+    if status != "000":
+        print(f"DART API 오류: status={status} {data.get('message', '')}", file=sys.stderr)
+        return None
+    page = {"list": data.get("list"), "total_page": data.get("total_page")}
+    _page_cache.set(cache_key, page)
+    return page
+
+
+def fetch_dart_list(bgn_de: str, end_de: str, page_no: int) -> Optional[List[Dict[str, Any]]]:
+    """DART list.json 한 페이지 조회. 성공 시 list 항목(데이터 없으면 빈 목록), 조회 실패 시 None."""
+    page = _fetch_dart_page(bgn_de, end_de, page_no)
+    if page is None:
+        return None
+    lst = page.get("list")
+    return lst if isinstance(lst, list) else []
+
+
+def load_dart_last_seen() -> Optional[date]:
+    """마지막 전송 접수일 조회. 상태 파일이 없거나 손상 시 None (콜드 스타트)."""
+    try:
+        text = DART_LAST_SEEN_FILE.read_text(encoding="utf-8").strip()
+        return date.fromisoformat(text[:10])
+    except (OSError, ValueError):
+        return None
+
+
+def save_dart_last_seen(items: List[Dict[str, Any]]) -> None:
+    """Spring 전송 성공 후 호출. 전송 항목 collectedAt 최댓값으로 마지막 접수일 갱신 (뒤로 가지 않음)."""
+    dates = [it["collectedAt"][:10] for it in items if it.get("collectedAt")]
+    if not dates:
+        return
+    latest = max(dates)
+    current = load_dart_last_seen()
+    if current is not None and current.isoformat() >= latest:
+        return
+    try:
+        atomic_write_text(DART_LAST_SEEN_FILE, latest)
+    except OSError as e:
+        print(f"DART 상태 파일 저장 실패: {e}", file=sys.stderr)
 
 
-def fetch_dart_for_days(days: int = DART_COLLECT_DAYS) -> List[Dict[str, Any]]:
-    """최근 N일 공시 전체 조회 (페이지네이션)."""
+def fetch_dart_for_days(days: int = DART_COLLECT_DAYS) -> Tuple[List[Dict[str, Any]], bool]:
+    """최근 N일 공시 전체 조회 (페이지네이션).
+    이전 전송 기록(load_dart_last_seen)이 있으면 그 접수일부터만 조회하고, 없으면 N일 전체 조회.
+    1페이지 응답의 total_page로 남은 페이지 수를 알면 2..P 페이지를 동시 조회.
+    (rows, complete) 반환. 조회 실패한 페이지가 있으면 complete=False이고, 이때는 전송 후에도
+    save_dart_last_seen을 호출하지 않음 — 최신순 1페이지 기준으로 접수일이 앞당겨지면
+    실패한 페이지의 이전 접수일 공시를 다시 조회하지 않게 되므로.
+    """
+    _page_cache.sweep()
     end_d = datetime.now().date()
     bgn_d = end_d - timedelta(days=days)
+    last_seen = load_dart_last_seen()
+    if last_seen is not None:
+        bgn_d = min(max(bgn_d, last_seen), end_d)
     bgn_de = bgn_d.strftime("%Y%m%d")
     end_de = end_d.strftime("%Y%m%d")
-    all_items: List[Dict[str, Any]] = []
-    page_no = 1
+    first = _fetch_dart_page(bgn_de, end_de, 1)
+    if first is None:
+        return [], False
+    first_list = first.get("list")
+    if not isinstance(first_list, list) or not first_list:
+        return [], True
+    all_items: List[Dict[str, Any]] = list(first_list)
+    if len(first_list) < MAX_PAGE_COUNT:
+        return all_items, True
+    try:
+        total_page = int(first.get("total_page") or 0)
+    except (TypeError, ValueError):
+        total_page = 0
+
+    if total_page > 1:
+        complete = True
+        with ThreadPoolExecutor(max_workers=DART_FETCH_WORKERS) as ex:
+            for page in ex.map(
+                lambda p: fetch_dart_list(bgn_de, end_de, p), range(2, total_page + 1)
+            ):
+                if page is None:
+                    complete = False
+                    continue
+                all_items.extend(page)
+        return all_items, complete
+    if total_page == 1:
+        return all_items, True
+
+    # total_page 미제공 시 순차 조회
+    page_no = 2
     while True:
         page = fetch_dart_list(bgn_de, end_de, page_no)
+        if page is None:
+            return all_items, False
         if not page:
             break
         all_items.extend(page)
         if len(page) < MAX_PAGE_COUNT:
             break
         page_no += 1
-    return all_items
+    return all_items, True
+
+
+def _row_to_item(row: Dict[str, Any], now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """DART list 항목 1건 → Spring collected-news item."""
+    report_nm = (row.get("report_nm") or "")[:500]
+    corp_name = row.get("corp_name") or ""
+    flr_nm = row.get("flr_nm") or ""
+    summary = f"{corp_name} / {flr_nm}".strip(" /") if (corp_name or flr_nm) else None
+    stock_code = row.get("stock_code")
+    signal_relevant = _matches_signal_keyword(report_nm) or _matches_signal_keyword(summary)
+    if signal_relevant:
+        event_type = DART_SIGNAL_EVENT_TYPE_PREFIX + (
+            (report_nm[:490] if report_nm else (summary or "")[:490])
+        )
+    else:
+        event_type = report_nm
+    return {
+        "source": "DART",
+        "market": "KR",
+        "itemType": "FACT",
+        "title": report_nm,
+        "summary": summary,
+        "url": _build_viewer_url(row.get("rcept_no") or ""),
+        "collectedAt": _parse_rcept_dt(row.get("rcept_dt"), now_iso),
+        "symbol": str(stock_code).strip() if stock_code else None,
+        "eventType": event_type,
+        "signalRelevant": signal_relevant,
+    }
 
 
 def to_collected_items(raw_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """DART list 항목을 Spring collected-news items 형식으로 변환.
     시그널 키워드 매칭 시 eventType에 DART_SIGNAL: 접두사로 저장해 시그널 반영 대상 표시.
     """
-    items = []
-    for row in raw_list:
-        rcept_no = row.get("rcept_no") or ""
-        report_nm = (row.get("report_nm") or "")[:500]
-        corp_name = row.get("corp_name") or ""
-        flr_nm = row.get("flr_nm") or ""
-        summary = f"{corp_name} / {flr_nm}".strip(" /") if (corp_name or flr_nm) else None
-        stock_code = row.get("stock_code")
-        symbol = str(stock_code).strip() if stock_code else None
-        signal_relevant = _matches_signal_keyword(report_nm) or _matches_signal_keyword(summary)
-        if signal_relevant:
-            event_type = DART_SIGNAL_EVENT_TYPE_PREFIX + (
-                (report_nm[:490] if report_nm else (summary or "")[:490])
-            )
-        else:
-            event_type = (report_nm or "")[:500]
-        items.append({
-            "source": "DART",
-            "market": "KR",
-            "itemType": "FACT",
-            "title": report_nm,
-            "summary": summary,
-            "url": _build_viewer_url(rcept_no),
-            "collectedAt": _parse_rcept_dt(row.get("rcept_dt")),
-            "symbol": symbol,
-            "eventType": event_type,
-            "signalRelevant": signal_relevant,
-        })
+    now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    items = [_row_to_item(row, now_iso) for row in raw_list]
     signal_count = sum(1 for it in items if it.get("signalRelevant"))
     if signal_count:
         _logger.info(
@@ -168,26 +289,25 @@ def post_to_spring(items: List[Dict[str, Any]]) -> bool:
     if not items:
         return True
     url = f"{SPRING_BASE_URL.rstrip('/')}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Internal-Data-Key": INTERNAL_KEY,
-        },
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            if resp.status != 200:
-                print(f"Spring API 오류: status={resp.status}", file=sys.stderr)
-                return False
-            body = json.loads(resp.read().decode())
-            print(f"DART 전송 완료: received={body.get('received', 0)}, saved={body.get('saved', 0)}")
-            return True
-    except urllib.error.HTTPError as e:
-        print(f"Spring API HTTP 오류: {e.code} {e.reason}", file=sys.stderr)
+        resp = _CLIENT.post(
+            url,
+            content=json_codec.iter_items_payload(items),
+            headers={
+                "Content-Type": "application/json",
+                "X-Internal-Data-Key": INTERNAL_KEY,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        if resp.status_code != 200:
+            print(f"Spring API 오류: status={resp.status_code}", file=sys.stderr)
+            return False
+        body = json_codec.loads(resp.content)
+        print(f"DART 전송 완료: received={body.get('received', 0)}, saved={body.get('saved', 0)}")
+        return True
+    except httpx.HTTPStatusError as e:
+        print(f"Spring API HTTP 오류: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
         return False
     except Exception as e:
         print(f"Spring API 요청 실패: {e}", file=sys.stderr)
@@ -198,11 +318,13 @@ def main() -> int:
     if not DART_API_KEY or not DART_API_KEY.strip():
         print("DART_API_KEY 미설정", file=sys.stderr)
         return 1
-    raw = fetch_dart_for_days(DART_COLLECT_DAYS)
+    raw, complete = fetch_dart_for_days(DART_COLLECT_DAYS)
     items = to_collected_items(raw)
     if not items:
         print("DART 수집 항목 없음")
     if post_to_spring(items):
+        if complete:
+            save_dart_last_seen(items)
         return 0
     return 1
 
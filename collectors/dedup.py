@@ -0,0 +1,111 @@
+"""
+수집 항목 URL 중복 제거 (공통).
+URL을 정규화(스킴·fragment·추적용 쿼리 파라미터 제거)한 뒤 64비트 정수 해시로 축약해 set 키로 사용.
+긴 URL 문자열(Google News는 수백 자) 대신 int를 보관하므로 set 메모리와 해시 비용이 작음.
+xxhash(xxh3) 설치 시 사용, 미설치 시 blake2b(8바이트).
+SeenUrls: Spring 전송 완료 키를 스케줄 실행 간 공유하는 LRU (파일 저장·복원).
+"""
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union
+from urllib.parse import urlsplit
+
+try:
+    from collectors.file_cache import atomic_write_text
+except ImportError:  # 스크립트 직접 실행 (python collectors/xxx.py)
+    from file_cache import atomic_write_text
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# 기사 식별과 무관한 추적용 쿼리 파라미터 (Google News의 oc=5 등)
+_TRACKING_PARAMS = frozenset({"oc", "fbclid", "gclid"})
+
+# 전송 완료 URL 보관 한도: 최대 건수, 보관 시간(초)
+SEEN_MAX_SIZE = 50_000
+SEEN_TTL_SEC = 24 * 3600
+
+
+def _is_tracking_param(pair: str) -> bool:
+    name = pair.split("=", 1)[0].lower()
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
+
+def canonical_url(url: str) -> str:
+    """중복 판정용 정규화 URL. 네이버 article_id처럼 쿼리에 식별자가 있는 경우를 위해 나머지 쿼리는 유지."""
+    parts = urlsplit(url.strip())
+    query = "&".join(kv for kv in parts.query.split("&") if kv and not _is_tracking_param(kv))
+    canonical = f"{parts.netloc.lower()}{parts.path}"
+    return f"{canonical}?{query}" if query else canonical
+
+
+def url_key(url: str) -> int:
+    """정규화 URL의 64비트 해시."""
+    data = canonical_url(url).encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class SeenUrls:
+    """전송 완료 URL 키 LRU. 최대 max_size건, 기록 후 ttl초가 지나면 만료.
+    매 스케줄 실행마다 같은 기사를 Spring에 다시 보내지 않도록 프로세스 수명 동안 유지하고,
+    save()/load()로 재기동 전후에도 이어서 사용.
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: int = SEEN_MAX_SIZE, ttl: float = SEEN_TTL_SEC):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, float]" = OrderedDict()  # 키 → 기록 시각(epoch)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: int) -> bool:
+        ts = self._entries.get(key)
+        if ts is None:
+            return False
+        if time.time() - ts > self.ttl:
+            del self._entries[key]
+            self._dirty = True
+            return False
+        self._entries.move_to_end(key)
+        return True
+
+    def add(self, key: int) -> None:
+        self._entries[key] = time.time()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def load(self) -> None:
+        """저장 파일에서 만료되지 않은 키 복원. 파일이 없거나 손상 시 빈 상태로 시작."""
+        try:
+            pairs = json.loads(self.path.read_text(encoding="utf-8"))
+            now = time.time()
+            for key, ts in pairs:
+                if now - float(ts) <= self.ttl:
+                    self._entries[int(key)] = float(ts)
+        except (OSError, ValueError, TypeError):
+            return
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """변경이 있을 때만 [키, 기록 시각] 목록을 원자적으로 저장."""
+        if not self._dirty:
+            return
+        try:
+            atomic_write_text(self.path, json.dumps(list(self._entries.items())))
+            self._dirty = False
+        except OSError as e:
+            print(f"전송 URL 기록 저장 실패: {self.path} - {e}", file=sys.stderr)
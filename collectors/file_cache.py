@@ -0,0 +1,97 @@
+"""
+디스크 기반 TTL 캐시 (JSON 파일 1개 = 항목 1개).
+각 파일은 {"ts": 저장시각(epoch), "ttl": 초, "data": 값} 형식이며,
+조회 시 time.time() - ts > ttl 이면 만료로 보고 파일을 삭제한 뒤 None 반환.
+키에 날짜가 들어가 다시 조회되지 않는 항목은 sweep()으로 일괄 삭제.
+"""
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+# 재기동 후에도 유지할 수집 상태 파일(마지막 수집 시점 등) 기본 디렉터리
+STATE_DIR = Path(
+    os.environ.get("COLLECTOR_STATE_DIR") or Path(__file__).resolve().parent.parent / ".state"
+)
+
+
+def atomic_write_text(path: Union[str, Path], text: str) -> None:
+    """임시 파일에 쓰고 fsync 후 os.replace로 교체. 읽는 쪽이 쓰다 만 파일을 보지 않도록 보장."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class FileCache:
+    """디렉터리 하나를 사용하는 JSON 파일 캐시. 키는 파일명으로 쓰이므로 안전한 문자로 치환."""
+
+    def __init__(self, directory: Union[str, Path], ttl: float):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{_UNSAFE_KEY_CHARS.sub('_', key)}.json"
+
+    @staticmethod
+    def _read_live(path: Path, now: float) -> Optional[dict]:
+        """유효한 항목 반환. 만료·손상 파일은 삭제 후 None, 없는 파일도 None."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            expired = now - float(entry["ts"]) > float(entry["ttl"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            expired = True
+        if expired:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        """유효한 캐시 값 반환. 없거나 만료·손상 시 None (만료·손상 파일은 삭제)."""
+        entry = self._read_live(self._path(key), time.time())
+        return entry.get("data") if entry is not None else None
+
+    def sweep(self) -> int:
+        """디렉터리의 만료·손상 항목 파일을 모두 삭제하고 삭제 수 반환.
+        get()은 같은 키를 다시 조회할 때만 만료 파일을 지우므로, 다시 쓰이지 않는 키는 이걸로 정리.
+        """
+        now = time.time()
+        removed = 0
+        try:
+            paths = list(self.directory.glob("*.json"))
+        except OSError:
+            return 0
+        for path in paths:
+            if self._read_live(path, now) is None:
+                removed += 1
+        return removed
+
+    def set(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """값 저장. 캐시는 최적화 용도이므로 쓰기 실패는 무시."""
+        entry = {"ts": time.time(), "ttl": self.ttl if ttl is None else ttl, "data": data}
+        try:
+            atomic_write_text(self._path(key), json.dumps(entry, ensure_ascii=False))
+        except OSError:
+            pass
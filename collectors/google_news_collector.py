@@ -12,16 +12,31 @@ Google News RSS 수집기 (Speed 계층 - Reuters 대안)
   - 요청 간격 최소 2초 권장
   - User-Agent 명시
 """
+import asyncio
+import multiprocessing
 import os
 import sys
-import json
-import time
-import urllib.request
-import urllib.error
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from xml.etree import ElementTree as ET
+from io import BytesIO
+from typing import List, Dict, Any, Optional, Set
+
+import httpx
+from lxml import etree
+
+try:
+    from collectors import http_client, json_codec
+    from collectors.dedup import SeenUrls, url_key
+    from collectors.file_cache import STATE_DIR
+    from collectors.keyword_matcher import KeywordMatcher
+except ImportError:  # 스크립트 직접 실행 (python collectors/google_news_collector.py)
+    import http_client
+    import json_codec
+    from dedup import SeenUrls, url_key
+    from file_cache import STATE_DIR
+    from keyword_matcher import KeywordMatcher
 
 SPRING_BASE_URL = os.environ.get("SPRING_BASE_URL", "http://localhost:8080")
 INTERNAL_KEY = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
@@ -41,6 +56,10 @@ SEARCH_QUERIES = [
 ]
 
 REQUEST_INTERVAL_SEC = 2
+# 동시 요청 슬롯 수. 각 슬롯은 요청 후 REQUEST_INTERVAL_SEC 만큼 쉬고 다음 쿼리 처리
+REQUEST_CONCURRENCY = 3
+# RSS 파싱(CPU)용 프로세스 수. 이벤트 루프 스레드를 막지 않고 여러 코어에서 병렬 파싱
+PARSE_WORKERS = max(1, min(len(SEARCH_QUERIES), os.cpu_count() or 1))
 
 SIGNAL_KEYWORDS_EN = [
     "surge", "plunge", "soar", "crash", "rally", "slump",
@@ -55,27 +74,33 @@ SIGNAL_KEYWORDS_EN = [
     "semiconductor", "chip", "nvidia", "apple", "tesla",
 ]
 
+# Spring 전송용 커넥션 풀 (프로세스 내 재사용). RSS 조회는 실행마다 AsyncClient 1개로 동시 조회
+_CLIENT = http_client.new_client(timeout=30)
+
+# 소문자 키워드로 오토마톤 1회 구성. 매칭 시 제목만 1회 lower()
+_SIGNAL_MATCHER = KeywordMatcher(SIGNAL_KEYWORDS_EN, ignore_case=True)
+
+# Spring 전송 완료 URL (스케줄 실행 간 공유). 재기동 시 파일에서 복원해 같은 기사 재전송 방지
+_SEEN_URLS = SeenUrls(STATE_DIR / "google_news_seen.json")
+_SEEN_URLS.load()
+
 
 def _matches_signal_keyword(text: Optional[str]) -> bool:
-    if not text:
-        return False
-    t = text.lower().strip()
-    for kw in SIGNAL_KEYWORDS_EN:
-        if kw.lower() in t:
-            return True
-    return False
+    return _SIGNAL_MATCHER.matches(text)
 
 
-def _parse_rss_date(date_str: Optional[str]) -> str:
-    """RFC 822 형식 날짜를 ISO 형식으로 변환."""
+def _parse_rss_date(date_str: Optional[str], now_iso: Optional[str] = None) -> str:
+    """RFC 822 형식 날짜를 ISO 형식으로 변환. 변환 불가 시 now_iso (호출 측에서 피드당 1회 계산해 전달)."""
+    if now_iso is None:
+        now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     if not date_str:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
     try:
         from email.utils import parsedate_to_datetime
         dt = parsedate_to_datetime(date_str)
         return dt.strftime("%Y-%m-%dT%H:%M:%S")
     except Exception:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
 
 
 def _build_google_news_url(query: str) -> str:
@@ -84,86 +109,162 @@ def _build_google_news_url(query: str) -> str:
     return f"{GOOGLE_NEWS_BASE}?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
 
 
-def _fetch_rss_feed(url: str) -> Optional[str]:
-    """RSS 피드 XML 가져오기."""
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": USER_AGENT},
-        method="GET",
-    )
+def _item_to_payload(
+    item: etree._Element, market: str, summary: str, event_type: str, now_iso: str
+) -> Optional[Dict[str, Any]]:
+    """<item> 요소 → collected-news item. 제목이 비면 None."""
+    title_el = item.find("title")
+    link_el = item.find("link")
+    pub_date_el = item.find("pubDate")
+    source_el = item.find("source")
+    
+    title = ((title_el.text or "") if title_el is not None else "").strip()
+    link = (link_el.text or "") if link_el is not None else ""
+    pub_date = (pub_date_el.text or "") if pub_date_el is not None else ""
+    source_name = (source_el.text or "Google News") if source_el is not None else "Google News"
+    
+    if not title:
+        return None
+    
+    return {
+        "source": f"GOOGLE_NEWS:{source_name}",
+        "market": market,
+        "itemType": "SPEED",
+        "title": title[:500],
+        "summary": summary,
+        "url": link.strip(),
+        "collectedAt": _parse_rss_date(pub_date, now_iso),
+        "symbol": None,
+        "eventType": event_type,
+        "signalRelevant": _matches_signal_keyword(title),
+    }
+
+
+def _parse_rss_items(xml_content: bytes, query: str, market: str) -> List[Dict[str, Any]]:
+    """RSS XML(bytes)을 lxml iterparse로 파싱하여 뉴스 항목 추출. 파싱 오류 시 그 전까지의 항목 반환.
+    응답 본문 전체를 받은 뒤 파싱 프로세스 풀에서 호출. </item>마다 항목으로 변환 후 요소를 해제해
+    DOM 전체를 유지하지 않음.
+    """
+    items: List[Dict[str, Any]] = []
+    # 쿼리 단위 상수는 항목 루프 밖에서 1회만 생성
+    summary = f"Query: {query}"
+    event_type = f"GOOGLE_{query.replace(' ', '_').upper()}"
+    now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read().decode("utf-8", errors="ignore")
+        # 외부 엔티티 미해석·네트워크 차단 (defusedxml 없이 XXE 방지)
+        for _event, elem in etree.iterparse(
+            BytesIO(xml_content), tag="item", resolve_entities=False, no_network=True
+        ):
+            item = _item_to_payload(elem, market, summary, event_type, now_iso)
+            if item is not None:
+                items.append(item)
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
+    except etree.XMLSyntaxError as e:
+        print(f"RSS XML 파싱 오류: {e}", file=sys.stderr)
+    return items
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """파싱용 프로세스 풀 (최초 사용 시 생성, 프로세스 수명 동안 재사용).
+    스레드가 있는 서버 프로세스에서 fork하지 않도록 spawn 컨텍스트 사용.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """파싱 프로세스 풀 종료 (앱 shutdown / CLI 종료 시)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+async def _fetch_rss_feed(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+    """RSS 피드 XML(bytes) 가져오기."""
+    try:
+        resp = await client.get(url)
+        resp.raise_for_status()
+        return resp.content
     except Exception as e:
         print(f"RSS 피드 조회 실패: {url} - {e}", file=sys.stderr)
         return None
 
 
-def _parse_rss_items(xml_content: str, query: str, market: str) -> List[Dict[str, Any]]:
-    """RSS XML을 파싱하여 뉴스 항목 추출."""
-    items = []
+async def _parse_off_loop(xml: bytes, query: str, market: str) -> List[Dict[str, Any]]:
+    """프로세스 풀에서 파싱. 풀이 깨졌으면 재생성 대신 이번 건은 현재 프로세스에서 파싱."""
+    loop = asyncio.get_running_loop()
     try:
-        root = ET.fromstring(xml_content)
-        channel = root.find("channel")
-        if channel is None:
-            return items
-        
-        for item in channel.findall("item"):
-            title_el = item.find("title")
-            link_el = item.find("link")
-            pub_date_el = item.find("pubDate")
-            source_el = item.find("source")
-            
-            title = (title_el.text or "") if title_el is not None else ""
-            link = (link_el.text or "") if link_el is not None else ""
-            pub_date = (pub_date_el.text or "") if pub_date_el is not None else ""
-            source_name = (source_el.text or "Google News") if source_el is not None else "Google News"
-            
-            if not title.strip():
-                continue
-            
-            signal_relevant = _matches_signal_keyword(title)
-            
-            items.append({
-                "source": f"GOOGLE_NEWS:{source_name}",
-                "market": market,
-                "itemType": "SPEED",
-                "title": title.strip()[:500],
-                "summary": f"Query: {query}",
-                "url": link.strip(),
-                "collectedAt": _parse_rss_date(pub_date),
-                "symbol": None,
-                "eventType": f"GOOGLE_{query.replace(' ', '_').upper()}",
-                "signalRelevant": signal_relevant,
-            })
-    except ET.ParseError as e:
-        print(f"RSS XML 파싱 오류: {e}", file=sys.stderr)
-    
-    return items
+        return await loop.run_in_executor(_get_parse_pool(), _parse_rss_items, xml, query, market)
+    except BrokenProcessPool as e:
+        print(f"RSS 파싱 프로세스 풀 오류, 직접 파싱: {e}", file=sys.stderr)
+        shutdown_parse_pool()
+        return _parse_rss_items(xml, query, market)
 
 
-def fetch_google_news() -> List[Dict[str, Any]]:
-    """Google News RSS 전체 수집."""
+async def _fetch_one(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, query: str, market: str
+) -> List[Dict[str, Any]]:
+    """쿼리 1건 조회·파싱. 요청 간격은 전역 sleep이 아닌 세마포어 슬롯 단위로 유지.
+    파싱은 슬롯을 반납한 뒤 프로세스 풀에서 수행.
+    """
+    async with semaphore:
+        xml = await _fetch_rss_feed(client, _build_google_news_url(query))
+        await asyncio.sleep(REQUEST_INTERVAL_SEC)
+    if not xml:
+        return []
+    return await _parse_off_loop(xml, query, market)
+
+
+async def fetch_google_news() -> List[Dict[str, Any]]:
+    """Google News RSS 전체 수집. 쿼리들을 동시에 조회 (REQUEST_CONCURRENCY 슬롯).
+    이미 Spring으로 전송한 URL(_SEEN_URLS)은 제외.
+    """
     all_items = []
-    seen_urls = set()
+    seen_keys: Set[int] = set()
+    semaphore = asyncio.Semaphore(REQUEST_CONCURRENCY)
     
-    for query, market in SEARCH_QUERIES:
-        url = _build_google_news_url(query)
-        xml = _fetch_rss_feed(url)
-        if xml:
-            items = _parse_rss_items(xml, query, market)
-            new_items = []
-            for item in items:
-                if item["url"] not in seen_urls:
-                    seen_urls.add(item["url"])
-                    new_items.append(item)
-            all_items.extend(new_items)
-            print(f"Google News '{query}' 수집: {len(new_items)}건")
-        time.sleep(REQUEST_INTERVAL_SEC)
+    async with http_client.new_async_client(
+        headers={"User-Agent": USER_AGENT}, timeout=30, follow_redirects=True
+    ) as client:
+        results = await asyncio.gather(
+            *[_fetch_one(client, semaphore, query, market) for query, market in SEARCH_QUERIES]
+        )
+    
+    for (query, _market), items in zip(SEARCH_QUERIES, results):
+        new_items = []
+        for item in items:
+            key = url_key(item["url"])
+            if key not in seen_keys and key not in _SEEN_URLS:
+                seen_keys.add(key)
+                new_items.append(item)
+        all_items.extend(new_items)
+        print(f"Google News '{query}' 수집: {len(new_items)}건")
     
     return all_items
 
 
+def mark_forwarded(items: List[Dict[str, Any]]) -> None:
+    """Spring 전송 성공 후 호출. 다음 실행부터 해당 URL은 수집 결과에서 제외."""
+    for item in items:
+        _SEEN_URLS.add(url_key(item["url"]))
+
+
+def save_seen_urls() -> None:
+    """전송 완료 URL 기록을 파일로 저장 (앱 shutdown / CLI 종료 시)."""
+    _SEEN_URLS.save()
+
+
 def post_to_spring(items: List[Dict[str, Any]]) -> dict:
     """Spring 내부 API로 수집 항목 전송."""
     if not INTERNAL_KEY:
@@ -172,21 +273,20 @@ def post_to_spring(items: List[Dict[str, Any]]) -> dict:
         return {"received": 0, "saved": 0}
     
     url = f"{SPRING_BASE_URL.rstrip('/')}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Internal-Data-Key": INTERNAL_KEY,
-        },
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"Spring API HTTP 오류: {e.code} {e.reason}", file=sys.stderr)
+        resp = _CLIENT.post(
+            url,
+            content=json_codec.iter_items_payload(items),
+            headers={
+                "Content-Type": "application/json",
+                "X-Internal-Data-Key": INTERNAL_KEY,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        return json_codec.loads(resp.content)
+    except httpx.HTTPStatusError as e:
+        print(f"Spring API HTTP 오류: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
         raise
     except Exception as e:
         print(f"Spring API 요청 실패: {e}", file=sys.stderr)
@@ -194,12 +294,17 @@ def post_to_spring(items: List[Dict[str, Any]]) -> dict:
 
 
 def main() -> int:
-    items = fetch_google_news()
+    try:
+        items = asyncio.run(fetch_google_news())
+    finally:
+        shutdown_parse_pool()
     if not items:
         print("Google News 수집 항목 없음")
         return 0
     try:
         result = post_to_spring(items)
+        mark_forwarded(items)
+        save_seen_urls()
         print(f"Google News 전송 완료: received={result.get('received', 0)}, saved={result.get('saved', 0)}")
         return 0
     except Exception as e:
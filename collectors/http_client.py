@@ -0,0 +1,104 @@
+"""
+공통 HTTP 클라이언트 (httpx).
+- new_client: keep-alive 커넥션 풀 + 연결 실패 재시도 트랜스포트를 쓰는 httpx.Client 생성.
+  모듈 단위로 1개 만들어 재사용하면 요청마다 TCP/TLS 핸드셰이크를 다시 하지 않음.
+- get_with_retry: 429/502/503 응답 시 Retry-After 또는 지수 백오프 후 GET 재시도.
+  POST(Spring 전송)는 멱등이 아니므로 상태 코드 재시도 대상에서 제외.
+- RateLimiter: 여러 스레드가 동시에 요청해도 초당 요청 수 상한 유지 (DART 페이지 동시 조회·네이버 페이지 간격).
+- new_async_client / aget_with_retry / AsyncRateLimiter: 위와 같은 동작의 asyncio(httpx.AsyncClient) 버전.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Optional
+
+import httpx
+
+RETRY_STATUS = frozenset({429, 502, 503})
+RETRY_TOTAL = 3
+RETRY_BACKOFF_SEC = 0.5
+
+POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+
+class RateLimiter:
+    """초당 rate회 이하로 요청 시점 배정 (스레드 안전). 각 호출자는 배정받은 시점까지만 대기."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            slot = max(time.monotonic(), self._next)
+            self._next = slot + self._interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter:
+    """RateLimiter의 asyncio 버전. 이벤트 루프 스레드 하나에서만 쓰므로 락 불필요."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        slot = max(time.monotonic(), self._next)
+        self._next = slot + self._interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def new_client(**kwargs: Any) -> httpx.Client:
+    """커넥션 풀·연결 재시도 설정된 httpx.Client. kwargs는 httpx.Client에 그대로 전달."""
+    transport = httpx.HTTPTransport(retries=RETRY_TOTAL, limits=POOL_LIMITS)
+    return httpx.Client(transport=transport, **kwargs)
+
+
+def new_async_client(**kwargs: Any) -> httpx.AsyncClient:
+    """new_client의 httpx.AsyncClient 버전."""
+    transport = httpx.AsyncHTTPTransport(retries=RETRY_TOTAL, limits=POOL_LIMITS)
+    return httpx.AsyncClient(transport=transport, **kwargs)
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return RETRY_BACKOFF_SEC * (2 ** attempt)
+
+
+def get_with_retry(
+    client: httpx.Client, url: str, limiter: Optional[RateLimiter] = None, **kwargs: Any
+) -> httpx.Response:
+    """GET 후 RETRY_STATUS 응답이면 최대 RETRY_TOTAL회 재시도. 마지막 응답은 상태와 무관하게 반환.
+    limiter가 있으면 재시도를 포함한 매 요청 전에 대기.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        if limiter is not None:
+            limiter.wait()
+        resp = client.get(url, **kwargs)
+        if resp.status_code not in RETRY_STATUS or attempt == RETRY_TOTAL:
+            return resp
+        resp.close()
+        time.sleep(_retry_delay(resp, attempt))
+    return resp
+
+
+async def aget_with_retry(
+    client: httpx.AsyncClient, url: str, limiter: Optional[AsyncRateLimiter] = None, **kwargs: Any
+) -> httpx.Response:
+    """get_with_retry의 asyncio 버전."""
+    for attempt in range(RETRY_TOTAL + 1):
+        if limiter is not None:
+            await limiter.wait()
+        resp = await client.get(url, **kwargs)
+        if resp.status_code not in RETRY_STATUS or attempt == RETRY_TOTAL:
+            return resp
+        await resp.aclose()
+        await asyncio.sleep(_retry_delay(resp, attempt))
+    return resp
@@ -0,0 +1,51 @@
+"""
+JSON 인코딩/디코딩 (공통).
+orjson(Rust 구현) 설치 시 사용, 미설치 시 표준 json으로 대체.
+dumps는 항상 UTF-8 bytes를 반환하고(.encode 불필요), loads는 bytes/str 모두 받음(.decode 불필요).
+iter_items_payload는 {"items": [...]} 본문을 조각 단위로 생성 (전송 본문 전체를 한 번에 만들지 않음).
+"""
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로 어느 쪽이든 이것으로 처리
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 스트리밍 본문 1조각당 항목 수. 항목마다 조각을 나누면 chunked 프레이밍·send 호출이 과해짐
+PAYLOAD_CHUNK_ITEMS = 100
+
+
+def iter_items_payload(items: Iterable[Any], chunk_items: int = PAYLOAD_CHUNK_ITEMS) -> Iterator[bytes]:
+    """{"items": [...]} JSON을 chunk_items개 항목 단위 bytes 조각으로 생성.
+    httpx content=에 넘기면 chunked 전송되어 직렬화와 송신이 겹치고 본문 전체 bytes를 만들지 않음.
+    조각을 이어 붙이면 dumps({"items": list(items)})와 같은 JSON.
+    """
+    it = iter(items)
+    yield b'{"items":['
+    first = True
+    while True:
+        batch = list(islice(it, chunk_items))
+        if not batch:
+            break
+        body = b",".join(dumps(item) for item in batch)
+        yield body if first else b"," + body
+        first = False
+    yield b"]}"
@@ -0,0 +1,42 @@
+"""
+시그널 키워드 다중 패턴 매칭 (공통).
+pyahocorasick(C 확장) 설치 시 Aho-Corasick 오토마톤을 모듈 로드 시 1회 구성해
+키워드 수(K)와 무관하게 본문 1회 스캔(O(N))으로 판정. 미설치 시 정규식 alternation으로 대체.
+"""
+import re
+from typing import Iterable, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """키워드 중 하나라도 부분 문자열로 포함되는지 판정. ignore_case=True면 소문자 기준 비교."""
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        words = sorted({kw.lower() if ignore_case else kw for kw in keywords if kw})
+        self._automaton = None
+        self._regex = None
+        if not words:
+            return
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for w in words:
+                self._automaton.add_word(w, w)
+            self._automaton.make_automaton()
+        else:
+            self._regex = re.compile("|".join(map(re.escape, words)))
+
+    def matches(self, text: Optional[str]) -> bool:
+        if not text or not isinstance(text, str):
+            return False
+        if self.ignore_case:
+            text = text.lower()
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        if self._regex is not None:
+            return self._regex.search(text) is not None
+        return False
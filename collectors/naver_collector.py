@@ -15,14 +15,24 @@
 """
 import os
 import sys
-import json
-import re
-import time
-import urllib.request
-import urllib.error
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from html.parser import HTMLParser
+from typing import List, Dict, Any, Optional, Set
+
+import httpx
+from lxml import etree
+from lxml import html as lhtml
+
+try:
+    from collectors import http_client, json_codec
+    from collectors.dedup import SeenUrls, url_key
+    from collectors.file_cache import STATE_DIR
+    from collectors.keyword_matcher import KeywordMatcher
+except ImportError:  # 스크립트 직접 실행 (python collectors/naver_collector.py)
+    import http_client
+    import json_codec
+    from dedup import SeenUrls, url_key
+    from file_cache import STATE_DIR
+    from keyword_matcher import KeywordMatcher
 
 SPRING_BASE_URL = os.environ.get("SPRING_BASE_URL", "http://localhost:8080")
 INTERNAL_KEY = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
@@ -51,92 +61,56 @@ SIGNAL_KEYWORDS_KR = [
 ]
 
 
-class NaverNewsHTMLParser(HTMLParser):
-    """네이버 금융 뉴스 HTML 파서."""
-    
-    def __init__(self):
-        super().__init__()
-        self.items = []
-        self.in_news_list = False
-        self.in_news_item = False
-        self.in_title = False
-        self.current_item = {}
-        self.current_data = ""
-    
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        
-        if tag == "ul" and "newsList" in attrs_dict.get("class", ""):
-            self.in_news_list = True
-        elif tag == "li" and self.in_news_list:
-            self.in_news_item = True
-            self.current_item = {}
-        elif tag == "a" and self.in_news_item:
-            href = attrs_dict.get("href", "")
-            if href and "news" in href:
-                self.in_title = True
-                full_url = href
-                if href.startswith("/"):
-                    full_url = "https://finance.naver.com" + href
-                elif not href.startswith("http"):
-                    full_url = "https://finance.naver.com/news/" + href
-                self.current_item["url"] = full_url
-    
-    def handle_endtag(self, tag):
-        if tag == "ul" and self.in_news_list:
-            self.in_news_list = False
-        elif tag == "li" and self.in_news_item:
-            if self.current_item.get("title"):
-                self.items.append(self.current_item)
-            self.in_news_item = False
-            self.current_item = {}
-        elif tag == "a" and self.in_title:
-            title = self.current_data.strip()
-            if title:
-                self.current_item["title"] = title[:500]
-            self.in_title = False
-            self.current_data = ""
-    
-    def handle_data(self, data):
-        if self.in_title:
-            self.current_data += data
+_SIGNAL_MATCHER = KeywordMatcher(SIGNAL_KEYWORDS_KR)
+
+# 모듈 단위 커넥션 풀 (keep-alive로 페이지·Spring 전송 간 TCP/TLS 핸드셰이크 재사용)
+_CLIENT = http_client.new_client(headers={"User-Agent": USER_AGENT}, timeout=30, follow_redirects=True)
+# 페이지 요청 시작 간격 REQUEST_INTERVAL_SEC 유지 (마지막 페이지 뒤 고정 sleep 없음)
+_RATE_LIMITER = http_client.RateLimiter(1 / REQUEST_INTERVAL_SEC)
+
+# 뉴스 링크 앵커 추출용 XPath (컴파일 1회, libxml2에서 평가)
+_NEWS_ANCHOR_XPATH = etree.XPath("//a[contains(@href, 'news')]")
+
+# 네이버 금융 페이지는 EUC-KR. 바이트를 그대로 넘겨 libxml2가 디코딩
+_HTML_PARSER = lhtml.HTMLParser(encoding="euc-kr")
+
+# Spring 전송 완료 URL (스케줄 실행 간 공유). 재기동 시 파일에서 복원해 같은 기사 재전송 방지
+_SEEN_URLS = SeenUrls(STATE_DIR / "naver_seen.json")
+_SEEN_URLS.load()
 
 
 def _matches_signal_keyword(text: Optional[str]) -> bool:
-    if not text:
-        return False
-    t = text.strip()
-    for kw in SIGNAL_KEYWORDS_KR:
-        if kw in t:
-            return True
-    return False
-
-
-def _fetch_page(url: str) -> Optional[str]:
-    """웹 페이지 HTML 가져오기."""
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": USER_AGENT},
-        method="GET",
-    )
+    return _SIGNAL_MATCHER.matches(text)
+
+
+def _fetch_page(url: str) -> Optional[bytes]:
+    """웹 페이지 HTML 가져오기. 429/502/503은 재시도."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read().decode("euc-kr", errors="ignore")
+        resp = http_client.get_with_retry(_CLIENT, url, limiter=_RATE_LIMITER)
+        resp.raise_for_status()
+        return resp.content
     except Exception as e:
         print(f"페이지 조회 실패: {url} - {e}", file=sys.stderr)
         return None
 
 
-def _parse_news_simple(html: str, category: str) -> List[Dict[str, Any]]:
-    """간단한 정규식 기반 파싱 (HTMLParser 대안)."""
+def _parse_news_simple(html: bytes, category: str) -> List[Dict[str, Any]]:
+    """lxml(libxml2) 기반 파싱. href에 news가 포함된 앵커의 링크·텍스트 추출."""
     items = []
+    if not html:
+        return items
     
-    pattern = r'<a[^>]*href=["\']([^"\']*news[^"\']*)["\'][^>]*>([^<]+)</a>'
-    matches = re.findall(pattern, html, re.IGNORECASE)
+    try:
+        doc = lhtml.fromstring(html, parser=_HTML_PARSER)
+    except (etree.ParserError, ValueError) as e:
+        print(f"HTML 파싱 오류: {e}", file=sys.stderr)
+        return items
     
+    now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     seen_titles = set()
-    for href, title in matches:
-        title = title.strip()
+    for a in _NEWS_ANCHOR_XPATH(doc):
+        href = a.get("href") or ""
+        title = " ".join(a.text_content().split())
         if not title or len(title) < 5:
             continue
         if title in seen_titles:
@@ -158,7 +132,7 @@ def _parse_news_simple(html: str, category: str) -> List[Dict[str, Any]]:
             "title": title[:500],
             "summary": None,
             "url": full_url,
-            "collectedAt": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            "collectedAt": now_iso,
             "symbol": None,
             "eventType": f"NAVER_{category}",
             "signalRelevant": signal_relevant,
@@ -168,9 +142,9 @@ def _parse_news_simple(html: str, category: str) -> List[Dict[str, Any]]:
 
 
 def fetch_naver_news() -> List[Dict[str, Any]]:
-    """네이버 금융 뉴스 전체 수집."""
+    """네이버 금융 뉴스 전체 수집. 이미 Spring으로 전송한 URL(_SEEN_URLS)은 제외."""
     all_items = []
-    seen_urls = set()
+    seen_keys: Set[int] = set()
     
     for url, category in NAVER_NEWS_URLS:
         html = _fetch_page(url)
@@ -178,16 +152,27 @@ def fetch_naver_news() -> List[Dict[str, Any]]:
             items = _parse_news_simple(html, category)
             new_items = []
             for item in items:
-                if item["url"] not in seen_urls:
-                    seen_urls.add(item["url"])
+                key = url_key(item["url"])
+                if key not in seen_keys and key not in _SEEN_URLS:
+                    seen_keys.add(key)
                     new_items.append(item)
             all_items.extend(new_items)
             print(f"네이버 금융 {category} 수집: {len(new_items)}건")
-        time.sleep(REQUEST_INTERVAL_SEC)
     
     return all_items
 
 
+def mark_forwarded(items: List[Dict[str, Any]]) -> None:
+    """Spring 전송 성공 후 호출. 다음 실행부터 해당 URL은 수집 결과에서 제외."""
+    for item in items:
+        _SEEN_URLS.add(url_key(item["url"]))
+
+
+def save_seen_urls() -> None:
+    """전송 완료 URL 기록을 파일로 저장 (앱 shutdown / CLI 종료 시)."""
+    _SEEN_URLS.save()
+
+
 def post_to_spring(items: List[Dict[str, Any]]) -> dict:
     """Spring 내부 API로 수집 항목 전송."""
     if not INTERNAL_KEY:
@@ -196,21 +181,20 @@ def post_to_spring(items: List[Dict[str, Any]]) -> dict:
         return {"received": 0, "saved": 0}
     
     url = f"{SPRING_BASE_URL.rstrip('/')}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Internal-Data-Key": INTERNAL_KEY,
-        },
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"Spring API HTTP 오류: {e.code} {e.reason}", file=sys.stderr)
+        resp = _CLIENT.post(
+            url,
+            content=json_codec.iter_items_payload(items),
+            headers={
+                "Content-Type": "application/json",
+                "X-Internal-Data-Key": INTERNAL_KEY,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        return json_codec.loads(resp.content)
+    except httpx.HTTPStatusError as e:
+        print(f"Spring API HTTP 오류: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
         raise
     except Exception as e:
         print(f"Spring API 요청 실패: {e}", file=sys.stderr)
@@ -224,6 +208,8 @@ def main() -> int:
         return 0
     try:
         result = post_to_spring(items)
+        mark_forwarded(items)
+        save_seen_urls()
         print(f"네이버 금융 전송 완료: received={result.get('received', 0)}, saved={result.get('saved', 0)}")
         return 0
     except Exception as e:
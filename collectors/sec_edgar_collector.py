@@ -6,15 +6,28 @@ SEC EDGAR 공시 수집 (submissions/CIK{cik}.json)
 유니버스: SEC_CIKS가 있으면 해당 CIK만 사용. 없으면 SEC_UNIVERSE(top100|top200|top500)에 따라
 매 실행마다 SEC company_tickers.json을 새로 받아와 그 시점 기준 상위 N개 CIK로 수집.
 (캐시 없음. TOP100/200/500은 상장·변동에 따라 매일 달라지므로 매번 최신 목록 수신 후 진행.)
+
+submissions 조회는 CIK별 마지막 ETag/Last-Modified를 보내는 조건부 GET. 304(변경 없음)면 본문·파싱 없이 건너뜀.
+새 검증값은 실행마다 따로 모아 수집 항목과 함께 반환하고, 그 실행의 Spring 전송 성공 후에만 저장
+(save_sec_validators) — 전송 실패분이나 겹쳐 실행된 다른 실행의 미전송분이 304로 누락되지 않도록.
 """
+import asyncio
 import os
+import sqlite3
 import sys
-import json
-import time
-import urllib.request
-import urllib.error
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta
+from itertools import islice, zip_longest
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
+
+try:
+    from collectors import http_client, json_codec
+    from collectors.file_cache import STATE_DIR
+except ImportError:  # 스크립트 직접 실행 (python collectors/sec_edgar_collector.py)
+    import http_client
+    import json_codec
+    from file_cache import STATE_DIR
 
 SEC_BASE_URL = os.environ.get("SEC_BASE_URL", "https://data.sec.gov").rstrip("/")
 SEC_API_KEY = (os.environ.get("SEC_API_KEY") or "").strip()
@@ -27,7 +40,10 @@ SEC_CIKS_LIST: List[str] = (
     if SEC_CIKS_STR
     else []  # 나중에 resolve_sec_ciks()로 채움
 )
-SEC_RATE_LIMIT_DELAY = 0.11  # SEC 10 req/sec 준수
+# SEC 10 req/sec 준수: 동시 요청 수와 무관하게 초당 요청 수 상한 유지
+SEC_MAX_REQUESTS_PER_SEC = 9
+# CIK 동시 조회 수 (진행 중 요청 상한)
+SEC_FETCH_CONCURRENCY = 5
 
 SPRING_BASE_URL = os.environ.get("SPRING_BASE_URL", "http://localhost:8080")
 INTERNAL_KEY = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
@@ -40,6 +56,58 @@ SEC_USER_AGENT = (
 COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 _UNIVERSE_TOP = {"top100": 100, "top200": 200, "top500": 500}
 
+# Spring 전송용 커넥션 풀 (프로세스 내 재사용). SEC 조회는 실행마다 AsyncClient 1개로 동시 조회
+_CLIENT = http_client.new_client(timeout=30, follow_redirects=True)
+_RATE_LIMITER = http_client.AsyncRateLimiter(SEC_MAX_REQUESTS_PER_SEC)
+
+# CIK별 submissions 조건부 GET 검증값 (cik → (etag, last_modified))
+SEC_VALIDATORS_DB = STATE_DIR / "sec_submissions.sqlite3"
+Validators = Dict[str, Tuple[str, str]]
+
+
+def _connect_validators_db() -> sqlite3.Connection:
+    SEC_VALIDATORS_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(SEC_VALIDATORS_DB))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS submissions_validators "
+        "(cik TEXT PRIMARY KEY, etag TEXT NOT NULL, last_modified TEXT NOT NULL)"
+    )
+    return conn
+
+
+def load_sec_validators() -> Validators:
+    """저장된 CIK별 (etag, last_modified). DB가 없거나 손상되면 빈 dict (전체 재조회)."""
+    if not SEC_VALIDATORS_DB.exists():
+        return {}
+    try:
+        conn = _connect_validators_db()
+        try:
+            rows = conn.execute("SELECT cik, etag, last_modified FROM submissions_validators").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"SEC 검증값 DB 조회 실패: {e}", file=sys.stderr)
+        return {}
+    return {cik: (etag, last_modified) for cik, etag, last_modified in rows}
+
+
+def save_sec_validators(pending: Validators) -> None:
+    """Spring 전송 성공 후 호출. 그 실행에서 받은 검증값(pending)을 저장 (다음 실행부터 304로 건너뜀)."""
+    if not pending:
+        return
+    try:
+        conn = _connect_validators_db()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO submissions_validators (cik, etag, last_modified) VALUES (?, ?, ?)",
+                    [(cik, etag, lm) for cik, (etag, lm) in pending.items()],
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"SEC 검증값 DB 저장 실패: {e}", file=sys.stderr)
+
 
 def _cik_to_10(cik_any: Any) -> str:
     """CIK를 10자리 문자열로 (앞 0 패딩)."""
@@ -53,8 +121,8 @@ def _cik_to_10(cik_any: Any) -> str:
     return s.zfill(10)
 
 
-def fetch_company_tickers_ciks(
-    _base_url: str, user_agent: str, limit: int = 200
+async def fetch_company_tickers_ciks(
+    client: httpx.AsyncClient, user_agent: str, limit: int = 200
 ) -> List[str]:
     """
     매 호출 시 SEC에서 최신 company_tickers.json을 받아와 CIK 목록 반환. 캐시 없음.
@@ -62,10 +130,12 @@ def fetch_company_tickers_ciks(
     limit만큼 상위(인덱스 순) 사용. 구조: {"0": {"cik_str": 320193, "ticker": "AAPL", ...}, ...}
     """
     url = "https://www.sec.gov/files/company_tickers.json"
-    req = urllib.request.Request(url, headers={"User-Agent": user_agent}, method="GET")
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
+        resp = await http_client.aget_with_retry(
+            client, url, limiter=_RATE_LIMITER, headers={"User-Agent": user_agent}
+        )
+        resp.raise_for_status()
+        data = json_codec.loads(resp.content)
         print(f"SEC company_tickers 최신 수신 완료, 상위 {limit}개 CIK 사용", file=sys.stderr)
     except Exception as e:
         print(f"SEC company_tickers 로드 실패: {e}", file=sys.stderr)
@@ -86,15 +156,16 @@ def fetch_company_tickers_ciks(
     return ciks
 
 
-def resolve_sec_ciks() -> List[str]:
+async def resolve_sec_ciks(client: httpx.AsyncClient) -> List[str]:
     """
     수집에 사용할 CIK 목록. SEC_CIKS가 있으면 해당 고정 목록.
     없으면 매번 SEC에서 최신 company_tickers 수신 후 SEC_UNIVERSE(top100|top200|top500)만큼 사용.
     """
     if SEC_CIKS_STR:
-        return [c.strip() for c in SEC_CIKS_STR.split(",") if c.strip()]
+        # 10자리 패딩 후 중복 제거 (입력 순서 유지). 숫자가 아닌 값은 제외
+        return list(dict.fromkeys(c for c in map(_cik_to_10, SEC_CIKS_STR.split(",")) if c))
     n = _UNIVERSE_TOP.get(SEC_UNIVERSE, 200)
-    ciks = fetch_company_tickers_ciks(SEC_BASE_URL, SEC_USER_AGENT, limit=n)
+    ciks = await fetch_company_tickers_ciks(client, SEC_USER_AGENT, limit=n)
     if not ciks:
         # fallback: 소수 대형주 (레거시 호환)
         return ["0000320193", "0000789019", "0001018724", "0001640148", "0001652044"]
@@ -109,41 +180,78 @@ def _build_document_url(cik: str, accession_number: str, primary_document: Optio
     return f"https://www.sec.gov/Archives/edgar/data/{cik}/{acc_no_dashes}/{doc}"
 
 
-def _parse_filing_date(filing_date: Optional[str]) -> str:
+def _fast_parse_date(s: str) -> date:
+    """YYYY-MM-DD 앞 10자를 슬라이스로 date 변환 (strptime 형식 문자열 해석 생략). 잘못된 값은 ValueError."""
+    return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+
+
+def _parse_filing_date(filing_date: Optional[str], now_iso: Optional[str] = None) -> str:
+    """filingDate → ISO. 변환 불가 시 now_iso (호출 측에서 실행당 1회 계산해 전달)."""
+    if now_iso is None:
+        now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     if not filing_date or len(filing_date) < 10:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
     try:
-        d = datetime.strptime(filing_date[:10], "%Y-%m-%d")
-        return d.strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{_fast_parse_date(filing_date).isoformat()}T00:00:00"
     except ValueError:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
 
 
-def fetch_submissions_for_cik(
+async def fetch_submissions_for_cik(
+    client: httpx.AsyncClient,
     base_url: str,
     api_key: str,
     cik: str,
     since_date: datetime,
     user_agent: str,
+    validators: Optional[Validators] = None,
+    pending: Optional[Validators] = None,
 ) -> List[Dict[str, Any]]:
-    """한 CIK에 대해 submissions JSON 조회 후 since_date 이후 제출 건만 반환."""
+    """한 CIK에 대해 submissions JSON 조회 후 since_date 이후 제출 건만 반환.
+    validators에 이전 검증값이 있으면 If-None-Match/If-Modified-Since 전송, 304면 빈 목록.
+    200 응답의 새 검증값은 pending(실행별 dict)에 기록.
+    """
     url = f"{base_url}/submissions/CIK{cik}.json"
     headers = {"User-Agent": user_agent}
     if api_key:
         headers["X-SEC-API-Key"] = api_key
-    req = urllib.request.Request(url, headers=headers, method="GET")
+    etag, last_modified = (validators or {}).get(cik, ("", ""))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"SEC API HTTP 오류 cik={cik}: {e.code} {e.reason}", file=sys.stderr)
-        if e.code == 403:
+        resp = await http_client.aget_with_retry(client, url, limiter=_RATE_LIMITER, headers=headers)
+        if resp.status_code == 304:
+            return []
+        resp.raise_for_status()
+        # 수 MB JSON 디코딩·행 순회는 워커 스레드에서 (이벤트 루프의 요청 처리·스케줄러를 막지 않도록)
+        items = await asyncio.to_thread(_decode_submissions, resp.content, cik, since_date)
+    except httpx.HTTPStatusError as e:
+        print(f"SEC API HTTP 오류 cik={cik}: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
+        if e.response.status_code == 403:
             print("  → User-Agent에 연락처 이메일 포함 권장. SEC_USER_AGENT 환경변수 설정.", file=sys.stderr)
         return []
     except Exception as e:
         print(f"SEC API 호출 실패 cik={cik}: {e}", file=sys.stderr)
         return []
+    new_etag = resp.headers.get("ETag", "")
+    new_last_modified = resp.headers.get("Last-Modified", "")
+    if pending is not None and (new_etag or new_last_modified):
+        pending[cik] = (new_etag, new_last_modified)
+    return items
+
+
+def _decode_submissions(content: bytes, cik: str, since_date: datetime) -> List[Dict[str, Any]]:
+    """submissions 응답 본문 디코딩 → items (asyncio.to_thread로 이벤트 루프 밖에서 실행)."""
+    return _submissions_to_items(json_codec.loads(content), cik, since_date)
+
 
+def _submissions_to_items(data: Dict[str, Any], cik: str, since_date: datetime) -> List[Dict[str, Any]]:
+    """submissions JSON → collected-news items (since_date 이후 제출 건).
+    filings.recent 배열은 최신 제출순이므로 기준일 이전 첫 항목에서 순회 종료.
+    기준일 비교는 ISO(YYYY-MM-DD) 문자열 비교로 먼저 하고, 통과한 행만 date로 변환.
+    """
     filings = data.get("filings") or {}
     recent = filings.get("recent") or {}
     accession_numbers = recent.get("accessionNumber") or []
@@ -153,20 +261,24 @@ def fetch_submissions_for_cik(
     company_name = (data.get("name") or "").strip()
     cik_trimmed = (data.get("cik") or cik).strip()
 
+    since_str = since_date.date().isoformat()
     items = []
-    for i in range(len(accession_numbers)):
-        fd_str = filing_dates[i] if i < len(filing_dates) else None
+    # 병렬 배열을 행 단위로 묶어 순회. 짧은 배열은 None으로 채우고, 행 수는 accessionNumber 기준
+    rows = islice(
+        zip_longest(accession_numbers, forms, filing_dates, primary_docs), len(accession_numbers)
+    )
+    for acc, form, fd_str, prim in rows:
         if not fd_str or len(fd_str) < 10:
             continue
+        if fd_str[:10] < since_str:
+            # 0 패딩 ISO 날짜는 문자열 순서 = 날짜 순서 (date 객체 생성 없이 비교)
+            # recent 배열은 최신 제출순: 이후 항목은 모두 기준일 이전이므로 나머지(최대 ~1000건) 순회 생략
+            break
         try:
-            fd = datetime.strptime(fd_str[:10], "%Y-%m-%d").date()
-            if fd < since_date.date():
-                continue
+            fd = _fast_parse_date(fd_str)
         except ValueError:
             continue
-        acc = accession_numbers[i]
-        form = (forms[i] if i < len(forms) else "").strip()
-        prim = primary_docs[i] if i < len(primary_docs) else None
+        form = (form or "").strip()
         is_8k = form.upper() == "8-K"
         event_type = "8K" if is_8k else (form or "")[:500]
         title = f"{company_name} - {form} ({fd_str})" if company_name and form else (form or acc or "SEC Filing")
@@ -180,7 +292,7 @@ def fetch_submissions_for_cik(
             "title": title,
             "summary": summary,
             "url": _build_document_url(cik_trimmed, acc, prim),
-            "collectedAt": _parse_filing_date(fd_str),
+            "collectedAt": f"{fd.isoformat()}T00:00:00",  # 위에서 변환한 fd 재사용 (재파싱 없음)
             "symbol": None,
             "eventType": event_type,
             "signalRelevant": is_8k,
@@ -188,27 +300,42 @@ def fetch_submissions_for_cik(
     return items
 
 
-def fetch_sec_recent_filings(days: Optional[int] = None) -> List[Dict[str, Any]]:
+async def fetch_sec_recent_filings(
+    days: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Validators]:
     """
     최근 N일 SEC 제출 건 수집. 매 실행 시 최신 유니버스(company_tickers) 수신 후 진행.
-    SEC 10 req/sec 준수.
+    CIK별 조회는 SEC_FETCH_CONCURRENCY개씩 동시 수행하되 SEC 10 req/sec 준수 (_RATE_LIMITER).
+    결과는 CIK 목록 순서대로 합침.
+    (items, 이번 실행의 새 검증값) 반환. 검증값은 items 전송 성공 후 save_sec_validators()로 저장.
     """
     n_days = days if days is not None else SEC_COLLECT_DAYS
     n_days = max(7, n_days)
     since = datetime.now() - timedelta(days=n_days)
-    ciks = resolve_sec_ciks()  # SEC_CIKS 없으면 매번 최신 company_tickers에서 로드
-    if not ciks:
-        return []
+    semaphore = asyncio.Semaphore(SEC_FETCH_CONCURRENCY)
+    validators = load_sec_validators()
+    pending: Validators = {}
+
+    async with http_client.new_async_client(
+        headers={"User-Agent": SEC_USER_AGENT}, timeout=30, follow_redirects=True
+    ) as client:
+        ciks = await resolve_sec_ciks(client)  # SEC_CIKS 없으면 매번 최신 company_tickers에서 로드
+        if not ciks:
+            return [], pending
+
+        async def fetch_one(cik: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await fetch_submissions_for_cik(
+                    client, SEC_BASE_URL, SEC_API_KEY, cik, since, SEC_USER_AGENT,
+                    validators=validators, pending=pending,
+                )
+
+        results = await asyncio.gather(*[fetch_one(cik) for cik in ciks])
+
     all_items: List[Dict[str, Any]] = []
-    for i, cik in enumerate(ciks):
-        if i > 0:
-            time.sleep(SEC_RATE_LIMIT_DELAY)
-        all_items.extend(
-            fetch_submissions_for_cik(
-                SEC_BASE_URL, SEC_API_KEY, cik, since, SEC_USER_AGENT
-            )
-        )
-    return all_items
+    for items in results:
+        all_items.extend(items)
+    return all_items, pending
 
 
 def post_to_spring(items: List[Dict[str, Any]]) -> bool:
@@ -219,26 +346,26 @@ def post_to_spring(items: List[Dict[str, Any]]) -> bool:
     if not items:
         return True
     url = f"{SPRING_BASE_URL.rstrip('/')}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Internal-Data-Key": INTERNAL_KEY,
-        },
-        method="POST",
-    )
+    data = json_codec.iter_items_payload(items)
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            if resp.status != 200:
-                print(f"Spring API 오류: status={resp.status}", file=sys.stderr)
-                return False
-            body = json.loads(resp.read().decode())
-            print(f"SEC EDGAR 전송 완료: received={body.get('received', 0)}, saved={body.get('saved', 0)}")
-            return True
-    except urllib.error.HTTPError as e:
-        print(f"Spring API HTTP 오류: {e.code} {e.reason}", file=sys.stderr)
+        resp = _CLIENT.post(
+            url,
+            content=data,
+            headers={
+                "Content-Type": "application/json",
+                "X-Internal-Data-Key": INTERNAL_KEY,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        if resp.status_code != 200:
+            print(f"Spring API 오류: status={resp.status_code}", file=sys.stderr)
+            return False
+        body = json_codec.loads(resp.content)
+        print(f"SEC EDGAR 전송 완료: received={body.get('received', 0)}, saved={body.get('saved', 0)}")
+        return True
+    except httpx.HTTPStatusError as e:
+        print(f"Spring API HTTP 오류: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
         return False
     except Exception as e:
         print(f"Spring API 요청 실패: {e}", file=sys.stderr)
@@ -246,10 +373,11 @@ def post_to_spring(items: List[Dict[str, Any]]) -> bool:
 
 
 def main() -> int:
-    items = fetch_sec_recent_filings(SEC_COLLECT_DAYS)
+    items, validators = asyncio.run(fetch_sec_recent_filings(SEC_COLLECT_DAYS))
     if not items:
         print("SEC EDGAR 수집 항목 없음")
     if post_to_spring(items):
+        save_sec_validators(validators)
         return 0
     return 1
 
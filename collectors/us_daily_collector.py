@@ -4,7 +4,7 @@ US 시장 일별 시세 수집 (yfinance).
 기준일 OHLCV·거래대금(volume*close) 수집 후 JSON 배열을 stdout으로 출력.
 Spring UsMarketCollectionService에서 이 서비스를 HTTP로 호출해 파싱·TB_DAILY_STOCK(MARKET=US) 저장.
 
-수정주가 정책(ADR 19): 팩터·백테스트 입력은 수정주가만 사용. yfinance history(auto_adjust=True)로
+수정주가 정책(ADR 19): 팩터·백테스트 입력은 수정주가만 사용. yfinance download(auto_adjust=True)로
 배당·분할 반영된 수정주가를 수집한다.
 
 유니버스: API 호출 시 Backend가 보낸 symbols 사용. CLI 기본값은 지수·섹터 ETF + 대표 주식(퀀트용).
@@ -19,14 +19,81 @@ import argparse
 import json
 import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # yfinance 미설치 환경 (yfinance 설치 시 함께 설치됨)
+    np = None
+
+# yfinance import(pandas·numpy 등 포함)는 비용이 크므로 모듈 로드 시 1회만 수행
+try:
+    import yfinance as yf
+    _HAS_YF = True
+except ImportError:
+    yf = None
+    _HAS_YF = False
+
+
+# yf.download 1회 요청당 종목 수 (Yahoo 요청 URL 길이 한계 고려)
+DOWNLOAD_CHUNK_SIZE = 50
+
+
+_PRICE_FIELDS = ("Open", "High", "Low", "Close")
+
+
+def _field_matrix(df, field: str, symbols: List[str]):
+    """yf.download 결과에서 필드 하나의 (날짜 × 종목) 값 행렬. 필드·종목이 없으면 NaN."""
+    if df.columns.nlevels > 1:
+        frame = df.xs(field, level=1, axis=1) if field in df.columns.get_level_values(1) else None
+    else:
+        # 단일 레벨 컬럼: 단일 종목 결과
+        frame = df[[field]].set_axis(symbols, axis=1) if field in df.columns else None
+    if frame is None:
+        return np.full((len(df.index), len(symbols)), np.nan)
+    return frame.reindex(columns=symbols).to_numpy(dtype=float)
+
+
+def _frame_to_rows(df, symbols: List[str]) -> List[Dict[str, Any]]:
+    """종목별 첫 유효 행(Close 존재)을 응답 형식으로 변환.
+    필드별 (날짜 × 종목) 행렬에서 종목마다 첫 유효 행 위치를 한 번에 구해 반올림·거래대금을 배열 연산으로 계산.
+    """
+    if df.columns.nlevels == 1 and len(symbols) != 1:
+        return []
+    close = _field_matrix(df, "Close", symbols)
+    valid = ~np.isnan(close)
+    pos = valid.argmax(axis=0)
+    cols = np.arange(len(symbols))
+
+    first = {f: (close if f == "Close" else _field_matrix(df, f, symbols))[pos, cols] for f in _PRICE_FIELDS}
+    volume = np.nan_to_num(_field_matrix(df, "Volume", symbols)[pos, cols]).astype(np.int64)
+    trd_val = (volume * np.nan_to_num(first["Close"])).astype(np.int64)
+    opens, highs, lows, closes = (np.round(first[f], 4).tolist() for f in _PRICE_FIELDS)
+    volumes = volume.tolist()
+    trd_vals = trd_val.tolist()
+
+    def num(v: float) -> Optional[float]:
+        return None if v != v else v
+
+    return [
+        {
+            "symbol": symbols[j],
+            "open": num(opens[j]),
+            "high": num(highs[j]),
+            "low": num(lows[j]),
+            "close": closes[j],
+            "volume": volumes[j],
+            "trdVal": trd_vals[j],
+        }
+        for j in np.flatnonzero(valid.any(axis=0)).tolist()
+    ]
 
 
 def fetch_us_daily(bas_dt: str, symbols: List[str]) -> List[Dict[str, Any]]:
-    """yfinance로 기준일 US 종목 OHLCV 수집. trdVal = volume * close (달러 거래대금)."""
-    try:
-        import yfinance as yf
-    except ImportError:
+    """yfinance로 기준일 US 종목 OHLCV 수집. trdVal = volume * close (달러 거래대금).
+    종목별 Ticker.history 대신 DOWNLOAD_CHUNK_SIZE 단위 yf.download 1회로 일괄 조회.
+    """
+    if not _HAS_YF:
         print("yfinance 미설치: pip install yfinance", file=sys.stderr)
         return []
 
@@ -34,54 +101,30 @@ def fetch_us_daily(bas_dt: str, symbols: List[str]) -> List[Dict[str, Any]]:
     start = base
     end = base + timedelta(days=1)
 
+    symbols = list(dict.fromkeys(s.strip() for s in symbols if s and s.strip()))
     rows = []
-    for symbol in symbols:
-        symbol = symbol.strip()
-        if not symbol:
-            continue
+    for i in range(0, len(symbols), DOWNLOAD_CHUNK_SIZE):
+        chunk = symbols[i:i + DOWNLOAD_CHUNK_SIZE]
         try:
-            ticker = yf.Ticker(symbol)
             # auto_adjust=True: 수정주가(배당·분할 반영). 팩터·백테스트는 수정주가만 사용(ADR 19).
-            hist = ticker.history(start=start, end=end, auto_adjust=True)
-            if hist is None or hist.empty:
-                continue
-            for idx, row in hist.iterrows():
-                open_p = row.get("Open")
-                high_p = row.get("High")
-                low_p = row.get("Low")
-                close_p = row.get("Close")
-                volume = row.get("Volume")
-                if close_p is None or (hasattr(close_p, "item") and str(close_p) == "nan"):
-                    continue
-                try:
-                    close_val = float(close_p)
-                    vol_val = int(float(volume)) if volume is not None and str(volume) != "nan" else 0
-                    trd_val = int(vol_val * close_val) if vol_val and close_val else 0
-                except (TypeError, ValueError):
-                    vol_val = 0
-                    trd_val = 0
-
-                def to_num(x):
-                    if x is None or (hasattr(x, "item") and str(x) == "nan"):
-                        return None
-                    try:
-                        return round(float(x), 4)
-                    except (TypeError, ValueError):
-                        return None
-
-                rows.append({
-                    "symbol": symbol,
-                    "open": to_num(open_p),
-                    "high": to_num(high_p),
-                    "low": to_num(low_p),
-                    "close": to_num(close_p),
-                    "volume": vol_val,
-                    "trdVal": trd_val,
-                })
-                break
+            df = yf.download(
+                tickers=chunk,
+                start=start,
+                end=end,
+                auto_adjust=True,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
         except Exception as e:
-            print(f"yfinance {symbol} 오류: {e}", file=sys.stderr)
+            print(f"yfinance {','.join(chunk)} 오류: {e}", file=sys.stderr)
+            continue
+        if df is None or df.empty:
             continue
+        try:
+            rows.extend(_frame_to_rows(df, chunk))
+        except Exception as e:
+            print(f"yfinance {','.join(chunk)} 변환 오류: {e}", file=sys.stderr)
     return rows
 
 
@@ -89,12 +132,25 @@ def fetch_us_daily(bas_dt: str, symbols: List[str]) -> List[Dict[str, Any]]:
 DEFAULT_SYMBOLS = "SPY,QQQ,IWM,TLT,IEF,BIL,GLD,DBC,XLK,XLF,XLE,XLV,XLY,XLP,XLB,XLI,XLC,AAPL,MSFT,GOOGL,AMZN,META,TSLA,NVDA,JPM,V,JNJ,WMT,UNH,HD,PG,MA,BAC,XOM,CVX"
 
 
+def self_check() -> bool:
+    """수집 가능 여부 확인 (yfinance import). app 기동 시·주기적 상태 확인용."""
+    if not _HAS_YF:
+        print("yfinance 미설치: pip install yfinance", file=sys.stderr)
+    return _HAS_YF
+
+
 def main():
     parser = argparse.ArgumentParser(description="US 일별 시세 수집 (yfinance)")
-    parser.add_argument("--bas-dt", required=True, help="기준일 YYYY-MM-DD")
+    parser.add_argument("--bas-dt", help="기준일 YYYY-MM-DD")
     parser.add_argument("--symbols", default=DEFAULT_SYMBOLS, help="쉼표 구분 종목 코드 (기본: 지수·섹터 ETF + 대표 주식)")
+    parser.add_argument("--self-check", action="store_true", help="수집 가능 여부만 확인 (정상 0, 실패 1로 종료)")
     args = parser.parse_args()
 
+    if args.self_check:
+        sys.exit(0 if self_check() else 1)
+    if not args.bas_dt:
+        parser.error("--bas-dt 필수")
+
     symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
     if not symbols:
         print("symbols 비어 있음", file=sys.stderr)
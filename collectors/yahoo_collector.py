@@ -11,25 +11,41 @@ Yahoo Finance 수집 스크립트 (Earnings Calendar 등)
 """
 import os
 import sys
-import json
-import urllib.request
-import urllib.error
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
+import httpx
+
+try:
+    from collectors import http_client, json_codec
+except ImportError:  # 스크립트 직접 실행 (python collectors/yahoo_collector.py)
+    import http_client
+    import json_codec
+
 SPRING_BASE_URL = os.environ.get("SPRING_BASE_URL", "http://localhost:8080")
 INTERNAL_KEY = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
 
+# Spring 전송용 커넥션 풀 (Yahoo 조회는 yfinance 내부 세션 사용)
+_CLIENT = http_client.new_client(timeout=30)
+
+# yfinance는 선택 의존성. import 비용이 크므로 모듈 로드 시 1회만 시도
+try:
+    import yfinance as yf
+    _HAS_YF = True
+except ImportError:
+    yf = None
+    _HAS_YF = False
+
 
 def fetch_earnings_from_yfinance() -> List[Dict[str, Any]]:
     """yfinance로 Earnings Calendar 수집 (설치 시에만 동작)"""
-    try:
-        import yfinance as yf
-    except ImportError:
+    if not _HAS_YF:
         return []
     items = []
     try:
-        today = datetime.now().date()
+        now = datetime.now()
+        today = now.date()
+        now_iso = now.strftime("%Y-%m-%dT%H:%M:%S")
         end = today + timedelta(days=7)
         calendar = yf.earnings_dates(today, end)
         if calendar is None or calendar.empty:
@@ -41,9 +57,9 @@ def fetch_earnings_from_yfinance() -> List[Dict[str, Any]]:
                 if hasattr(report_date, "strftime"):
                     collected_at = report_date.strftime("%Y-%m-%dT%H:%M:%S")
                 else:
-                    collected_at = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+                    collected_at = now_iso
             else:
-                collected_at = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+                collected_at = now_iso
             items.append({
                 "source": "YAHOO_FINANCE",
                 "market": "US",
@@ -68,26 +84,25 @@ def post_to_spring(items: List[Dict[str, Any]]) -> bool:
     if not items:
         return True
     url = f"{SPRING_BASE_URL.rstrip('/')}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Internal-Data-Key": INTERNAL_KEY,
-        },
-        method="POST",
-    )
+    data = json_codec.iter_items_payload(items)
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            if resp.status != 200:
-                print(f"Spring API 오류: status={resp.status}", file=sys.stderr)
-                return False
-            body = json.loads(resp.read().decode())
-            print(f"전송 완료: received={body.get('received', 0)}, saved={body.get('saved', 0)}")
-            return True
-    except urllib.error.HTTPError as e:
-        print(f"Spring API HTTP 오류: {e.code} {e.reason}", file=sys.stderr)
+        resp = _CLIENT.post(
+            url,
+            content=data,
+            headers={
+                "Content-Type": "application/json",
+                "X-Internal-Data-Key": INTERNAL_KEY,
+            },
+        )
+        resp.raise_for_status()
+        if resp.status_code != 200:
+            print(f"Spring API 오류: status={resp.status_code}", file=sys.stderr)
+            return False
+        body = json_codec.loads(resp.content)
+        print(f"전송 완료: received={body.get('received', 0)}, saved={body.get('saved', 0)}")
+        return True
+    except httpx.HTTPStatusError as e:
+        print(f"Spring API HTTP 오류: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
         return False
     except Exception as e:
         print(f"Spring API 요청 실패: {e}", file=sys.stderr)
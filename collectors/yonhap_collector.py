@@ -12,15 +12,26 @@
   - 요청 간격 최소 3분 권장
   - User-Agent 명시
 """
+import asyncio
 import os
+import re
 import sys
-import json
+import threading
 import time
-import urllib.request
-import urllib.error
 from datetime import datetime
+from email.utils import parsedate
 from typing import List, Dict, Any, Optional
-from xml.etree import ElementTree as ET
+
+import httpx
+from lxml import etree
+
+try:
+    from collectors import http_client, json_codec
+    from collectors.keyword_matcher import KeywordMatcher
+except ImportError:  # 스크립트 직접 실행 (python collectors/yonhap_collector.py)
+    import http_client
+    import json_codec
+    from keyword_matcher import KeywordMatcher
 
 SPRING_BASE_URL = os.environ.get("SPRING_BASE_URL", "http://localhost:8080")
 INTERNAL_KEY = os.environ.get("DATA_COLLECTION_INTERNAL_KEY", "")
@@ -34,6 +45,11 @@ YONHAP_FEED_URLS = [
 
 REQUEST_INTERVAL_SEC = 2
 
+# Spring 전송용 커넥션 풀 (프로세스 내 재사용). 피드 조회는 실행마다 AsyncClient 1개로 동시 조회
+_CLIENT = http_client.new_client(headers={"User-Agent": USER_AGENT}, timeout=30, follow_redirects=True)
+# 피드는 동시 조회하되 요청 시작 간격은 REQUEST_INTERVAL_SEC 유지 (마지막 피드 뒤 고정 sleep 없음)
+_RATE_LIMITER = http_client.AsyncRateLimiter(1 / REQUEST_INTERVAL_SEC)
+
 SIGNAL_KEYWORDS_KR = [
     "급등", "급락", "폭등", "폭락",
     "상한가", "하한가",
@@ -48,97 +64,135 @@ SIGNAL_KEYWORDS_KR = [
 ]
 
 
+# 키워드 전체로 오토마톤 1회 구성 (키워드 수와 무관하게 텍스트 1회 스캔)
+_SIGNAL_MATCHER = KeywordMatcher(SIGNAL_KEYWORDS_KR)
+
+
 def _matches_signal_keyword(text: Optional[str]) -> bool:
-    if not text:
-        return False
-    t = text.strip()
-    for kw in SIGNAL_KEYWORDS_KR:
-        if kw in t:
-            return True
-    return False
+    return _SIGNAL_MATCHER.matches(text)
 
 
-def _parse_rss_date(date_str: Optional[str]) -> str:
-    """RFC 822 형식 날짜를 ISO 형식으로 변환."""
+def _parse_rss_date(date_str: Optional[str], now_iso: Optional[str] = None) -> str:
+    """RFC 822 형식 날짜를 ISO 형식으로 변환. 변환 불가 시 now_iso (호출 측에서 피드당 1회 계산해 전달).
+    parsedate의 시간 튜플을 바로 포맷 (datetime·tzinfo 생성 없이 피드 표기 시각 그대로).
+    """
+    if now_iso is None:
+        now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     if not date_str:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return now_iso
+    parsed = parsedate(date_str)
+    if parsed is None:
+        return now_iso
     try:
-        from email.utils import parsedate_to_datetime
-        dt = parsedate_to_datetime(date_str)
-        return dt.strftime("%Y-%m-%dT%H:%M:%S")
-    except Exception:
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-
-
-def _fetch_rss_feed(url: str) -> Optional[str]:
-    """RSS 피드 XML 가져오기."""
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": USER_AGENT},
-        method="GET",
-    )
+        return time.strftime("%Y-%m-%dT%H:%M:%S", parsed)
+    except (ValueError, OverflowError):
+        return now_iso
+
+
+async def _fetch_rss_feed(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+    """RSS 피드 XML(bytes) 가져오기. 디코딩은 파서(libxml2)가 XML 선언 인코딩으로 수행."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read().decode("utf-8", errors="ignore")
+        resp = await http_client.aget_with_retry(client, url, limiter=_RATE_LIMITER)
+        resp.raise_for_status()
+        return resp.content
     except Exception as e:
         print(f"RSS 피드 조회 실패: {url} - {e}", file=sys.stderr)
         return None
 
 
-def _parse_rss_items(xml_content: str, category: str) -> List[Dict[str, Any]]:
-    """RSS XML을 파싱하여 뉴스 항목 추출."""
+# <item> 블록만 바이트 수준에서 찾아 항목별로 파싱 (channel 등 나머지 문서는 DOM으로 만들지 않음)
+_ITEM_RE = re.compile(rb"<item\b[^>]*>.*?</item>", re.DOTALL)
+# 항목 조각에는 XML 선언이 없으므로 문서 선언의 인코딩을 파서에 직접 지정 (EUC-KR 피드 등)
+_XML_ENCODING_RE = re.compile(rb"""^\s*<\?xml[^>]*?encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+# lxml 파서는 스레드 간 공유 불가: 워커 스레드(asyncio.to_thread)마다 인코딩별 파서 캐시
+_ITEM_PARSERS = threading.local()
+
+
+def _item_parser(xml_content: bytes) -> etree.XMLParser:
+    """문서 선언 인코딩용 XMLParser (스레드·인코딩별 1회 생성). 선언이 없거나 모르는 인코딩이면 UTF-8."""
+    m = _XML_ENCODING_RE.match(xml_content)
+    encoding = m.group(1).decode("ascii").lower() if m else None
+    parsers: Optional[Dict[Optional[str], etree.XMLParser]] = getattr(_ITEM_PARSERS, "by_encoding", None)
+    if parsers is None:
+        parsers = _ITEM_PARSERS.by_encoding = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        # recover: 깨진 바이트·태그는 건너뛰고 계속 (기존 decode(errors="ignore")와 같은 관용)
+        options = dict(recover=True, resolve_entities=False, no_network=True)
+        try:
+            parser = etree.XMLParser(encoding=encoding, **options)
+        except LookupError:
+            parser = etree.XMLParser(**options)
+        parsers[encoding] = parser
+    return parser
+
+
+def _parse_rss_items(xml_content: bytes, category: str) -> List[Dict[str, Any]]:
+    """RSS XML(bytes)에서 <item> 블록만 정규식으로 찾아 항목별로 lxml 파싱하여 뉴스 항목 추출.
+    <item>이 없는 문서는 파싱 없이 빈 목록, 깨진 항목은 그 항목만 건너뜀.
+    """
     items = []
-    try:
-        root = ET.fromstring(xml_content)
-        channel = root.find("channel")
-        if channel is None:
-            return items
+    now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    event_type = f"YONHAP_{category}"
+    parser = None
+    for m in _ITEM_RE.finditer(xml_content):
+        if parser is None:
+            parser = _item_parser(xml_content)
+        try:
+            item = etree.fromstring(m.group(), parser)
+        except etree.XMLSyntaxError as e:
+            print(f"RSS XML 파싱 오류: {e}", file=sys.stderr)
+            continue
+        if item is None:
+            continue
+        title = item.findtext("title") or ""
+        link = item.findtext("link") or ""
+        desc = item.findtext("description") or ""
+        pub_date = item.findtext("pubDate") or ""
+        
+        if not title.strip():
+            continue
+        
+        # 제목·설명을 구분자(\x00)로 이어 1회 스캔. 구분자를 걸친 오매칭 없음
+        signal_relevant = _matches_signal_keyword(f"{title}\x00{desc}")
         
-        for item in channel.findall("item"):
-            title_el = item.find("title")
-            link_el = item.find("link")
-            desc_el = item.find("description")
-            pub_date_el = item.find("pubDate")
-            
-            title = (title_el.text or "") if title_el is not None else ""
-            link = (link_el.text or "") if link_el is not None else ""
-            desc = (desc_el.text or "") if desc_el is not None else ""
-            pub_date = (pub_date_el.text or "") if pub_date_el is not None else ""
-            
-            if not title.strip():
-                continue
-            
-            signal_relevant = _matches_signal_keyword(title) or _matches_signal_keyword(desc)
-            
-            items.append({
-                "source": "YONHAP",
-                "market": "KR",
-                "itemType": "SPEED",
-                "title": title.strip()[:500],
-                "summary": desc.strip()[:1000] if desc else None,
-                "url": link.strip(),
-                "collectedAt": _parse_rss_date(pub_date),
-                "symbol": None,
-                "eventType": f"YONHAP_{category}",
-                "signalRelevant": signal_relevant,
-            })
-    except ET.ParseError as e:
-        print(f"RSS XML 파싱 오류: {e}", file=sys.stderr)
+        items.append({
+            "source": "YONHAP",
+            "market": "KR",
+            "itemType": "SPEED",
+            "title": title.strip()[:500],
+            "summary": desc.strip()[:1000] if desc else None,
+            "url": link.strip(),
+            "collectedAt": _parse_rss_date(pub_date, now_iso),
+            "symbol": None,
+            "eventType": event_type,
+            "signalRelevant": signal_relevant,
+        })
     
     return items
 
 
-def fetch_yonhap_news() -> List[Dict[str, Any]]:
-    """연합뉴스 RSS 전체 수집."""
-    all_items = []
-    for url, category in YONHAP_FEED_URLS:
-        xml = _fetch_rss_feed(url)
-        if xml:
-            items = _parse_rss_items(xml, category)
-            all_items.extend(items)
-            print(f"연합뉴스 {category} 수집: {len(items)}건")
-        time.sleep(REQUEST_INTERVAL_SEC)
-    return all_items
+async def _collect_feed(client: httpx.AsyncClient, url: str, category: str) -> List[Dict[str, Any]]:
+    """피드 1개 조회 → 파싱. 도착한 피드는 바로 파싱하므로 다음 피드의 요청 간격 대기와 겹침.
+    파싱은 워커 스레드에서 수행 (이벤트 루프의 요청 처리·스케줄러를 막지 않도록).
+    """
+    xml = await _fetch_rss_feed(client, url)
+    if not xml:
+        return []
+    items = await asyncio.to_thread(_parse_rss_items, xml, category)
+    print(f"연합뉴스 {category} 수집: {len(items)}건")
+    return items
+
+
+async def fetch_yonhap_news() -> List[Dict[str, Any]]:
+    """연합뉴스 RSS 전체 수집. 피드를 동시에 조회하고 결과는 피드 목록 순서대로 합침."""
+    async with http_client.new_async_client(
+        headers={"User-Agent": USER_AGENT}, timeout=30, follow_redirects=True
+    ) as client:
+        per_feed = await asyncio.gather(
+            *[_collect_feed(client, url, category) for url, category in YONHAP_FEED_URLS]
+        )
+    return [item for items in per_feed for item in items]
 
 
 def post_to_spring(items: List[Dict[str, Any]]) -> dict:
@@ -149,21 +203,21 @@ def post_to_spring(items: List[Dict[str, Any]]) -> dict:
         return {"received": 0, "saved": 0}
     
     url = f"{SPRING_BASE_URL.rstrip('/')}/api/v1/internal/collected-news"
-    data = json.dumps({"items": items}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Internal-Data-Key": INTERNAL_KEY,
-        },
-        method="POST",
-    )
+    data = json_codec.iter_items_payload(items)
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"Spring API HTTP 오류: {e.code} {e.reason}", file=sys.stderr)
+        resp = _CLIENT.post(
+            url,
+            content=data,
+            headers={
+                "Content-Type": "application/json",
+                "X-Internal-Data-Key": INTERNAL_KEY,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        return json_codec.loads(resp.content)
+    except httpx.HTTPStatusError as e:
+        print(f"Spring API HTTP 오류: {e.response.status_code} {e.response.reason_phrase}", file=sys.stderr)
         raise
     except Exception as e:
         print(f"Spring API 요청 실패: {e}", file=sys.stderr)
@@ -171,7 +225,7 @@ def post_to_spring(items: List[Dict[str, Any]]) -> dict:
 
 
 def main() -> int:
-    items = fetch_yonhap_news()
+    items = asyncio.run(fetch_yonhap_news())
     if not items:
         print("연합뉴스 수집 항목 없음")
         return 0
@@ -2,12 +2,29 @@
 """
 DART collector 단위 테스트.
 - 시그널 키워드(무상증자, 감자 등) 매칭 시 signalRelevant=True, eventType DART_SIGNAL: 접두사 검증.
+- total_page 기반 페이지네이션 결과 순서 검증.
+- 마지막 전송 접수일 기반 증분 조회 구간 검증.
+- rcept_dt(YYYYMMDD) → ISO 변환 검증.
+- list.json 조회 실패(None)와 데이터 없음(빈 목록) 구분 검증.
 """
+import tempfile
 import unittest
-from typing import Any, Dict, List
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest import mock
 
+import httpx
+
+from collectors import dart_collector, json_codec
 from collectors.dart_collector import (
     DART_SIGNAL_EVENT_TYPE_PREFIX,
+    MAX_PAGE_COUNT,
+    _parse_rcept_dt,
+    fetch_dart_for_days,
+    fetch_dart_list,
+    load_dart_last_seen,
+    save_dart_last_seen,
     to_collected_items,
 )
 
@@ -113,5 +130,162 @@ class TestDartCollectorSignalKeywords(unittest.TestCase):
         self.assertEqual(item["symbol"], "005930")
 
 
+class TestDartRceptDt(unittest.TestCase):
+    """접수일 문자열 변환 검증."""
+
+    def test_yyyymmdd_is_sliced_to_iso(self) -> None:
+        self.assertEqual(_parse_rcept_dt("20240315"), "2024-03-15T00:00:00")
+        self.assertEqual(_parse_rcept_dt("20241231000000"), "2024-12-31T00:00:00")
+        self.assertEqual(_parse_rcept_dt("20240229"), "2024-02-29T00:00:00")
+
+    def test_invalid_values_fall_back_to_now(self) -> None:
+        """빈 값·짧은 값·비숫자·범위 밖 월·존재하지 않는 날짜는 현재 시각."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        for value in (None, "", "2024031", "2024-03-15", "20241315", "20240231", "20230431"):
+            with self.subTest(value=value):
+                self.assertTrue(_parse_rcept_dt(value).startswith(today))
+
+    def test_invalid_values_use_given_now_iso(self) -> None:
+        """호출 측이 계산한 now_iso를 그대로 사용 (항목마다 현재 시각 재계산 없음)."""
+        for value in (None, "2024-03-15", "20241315", "20240231"):
+            with self.subTest(value=value):
+                self.assertEqual(_parse_rcept_dt(value, "NOW"), "NOW")
+
+
+class TestDartPagination(unittest.TestCase):
+    """1페이지 total_page 기반 나머지 페이지 조회 검증."""
+
+    @staticmethod
+    def _fake_pages(total_page: Optional[int], sizes: List[int]):
+        def fake(bgn_de: str, end_de: str, page_no: int) -> Optional[Dict[str, Any]]:
+            if page_no > len(sizes):
+                return None
+            rows = [{"rcept_no": f"{page_no}-{i}"} for i in range(sizes[page_no - 1])]
+            return {"list": rows, "total_page": total_page}
+        return fake
+
+    def test_remaining_pages_are_fetched_in_page_order(self) -> None:
+        """total_page=3이면 2, 3페이지를 조회하고 페이지 순서대로 합침."""
+        fake = self._fake_pages(3, [MAX_PAGE_COUNT, MAX_PAGE_COUNT, 7])
+        with mock.patch.object(dart_collector, "_fetch_dart_page", side_effect=fake) as m:
+            rows, complete = fetch_dart_for_days(3)
+        self.assertTrue(complete)
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(len(rows), 2 * MAX_PAGE_COUNT + 7)
+        self.assertEqual(rows[0]["rcept_no"], "1-0")
+        self.assertEqual(rows[MAX_PAGE_COUNT]["rcept_no"], "2-0")
+        self.assertEqual(rows[-1]["rcept_no"], "3-6")
+
+    def test_short_first_page_stops_without_more_calls(self) -> None:
+        """1페이지가 MAX_PAGE_COUNT 미만이면 추가 조회 없음."""
+        fake = self._fake_pages(1, [5])
+        with mock.patch.object(dart_collector, "_fetch_dart_page", side_effect=fake) as m:
+            rows, complete = fetch_dart_for_days(3)
+        self.assertTrue(complete)
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(rows), 5)
+
+    def test_missing_total_page_falls_back_to_sequential(self) -> None:
+        """total_page가 없으면 빈/짧은 페이지까지 순차 조회."""
+        fake = self._fake_pages(None, [MAX_PAGE_COUNT, 3])
+        with mock.patch.object(dart_collector, "_fetch_dart_page", side_effect=fake):
+            rows, complete = fetch_dart_for_days(3)
+        self.assertTrue(complete)
+        self.assertEqual(len(rows), MAX_PAGE_COUNT + 3)
+
+    def test_failed_page_marks_run_incomplete(self) -> None:
+        """2페이지 조회 실패 시 나머지 페이지는 반환하되 complete=False (동시·순차 조회 모두)."""
+        for total_page in (3, None):
+            with self.subTest(total_page=total_page):
+                good = self._fake_pages(total_page, [MAX_PAGE_COUNT, MAX_PAGE_COUNT, 7])
+
+                def fake(bgn_de: str, end_de: str, page_no: int) -> Optional[Dict[str, Any]]:
+                    return None if page_no == 2 else good(bgn_de, end_de, page_no)
+
+                with mock.patch.object(dart_collector, "_fetch_dart_page", side_effect=fake):
+                    rows, complete = fetch_dart_for_days(3)
+                self.assertFalse(complete)
+                self.assertEqual(rows[0]["rcept_no"], "1-0")
+                self.assertNotIn("2-0", [r["rcept_no"] for r in rows])
+
+    def test_failed_first_page_is_incomplete_empty_page_is_complete(self) -> None:
+        with mock.patch.object(dart_collector, "_fetch_dart_page", return_value=None):
+            self.assertEqual(fetch_dart_for_days(3), ([], False))
+        with mock.patch.object(dart_collector, "_fetch_dart_page", return_value={"list": [], "total_page": 0}):
+            self.assertEqual(fetch_dart_for_days(3), ([], True))
+
+
+class TestDartPageStatus(unittest.TestCase):
+    """list.json 응답 status별 페이지 결과 검증."""
+
+    def _fetch(self, status_code: int, body: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        client = httpx.Client(transport=httpx.MockTransport(
+            lambda _req: httpx.Response(status_code, content=json_codec.dumps(body))
+        ))
+        self.addCleanup(client.close)
+        with mock.patch.object(dart_collector, "DART_API_KEY", "key"), \
+                mock.patch.object(dart_collector, "_CLIENT", client), \
+                mock.patch.object(dart_collector, "_page_cache", dart_collector.FileCache(tmp.name, ttl=60)):
+            return fetch_dart_list("20240101", "20240103", 1)
+
+    def test_ok_status_returns_rows(self) -> None:
+        rows = [{"rcept_no": "1"}]
+        self.assertEqual(self._fetch(200, {"status": "000", "list": rows, "total_page": 1}), rows)
+
+    def test_no_data_status_is_empty_page(self) -> None:
+        """013(조회 데이터 없음)은 실패가 아닌 빈 페이지."""
+        self.assertEqual(self._fetch(200, {"status": "013", "message": "조회된 데이타가 없습니다."}), [])
+
+    def test_failures_return_none(self) -> None:
+        """HTTP 오류·오류 status(020 요청 제한 등)는 None으로 구분."""
+        self.assertIsNone(self._fetch(500, {}))
+        self.assertIsNone(self._fetch(200, {"status": "020", "message": "요청 제한 초과"}))
+
+
+class TestDartIncrementalWindow(unittest.TestCase):
+    """마지막 전송 접수일(state 파일) 기반 조회 시작일 검증."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(dart_collector, "DART_LAST_SEEN_FILE", Path(tmp.name) / "dart_last_seen")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _requested_bgn_de(self) -> str:
+        with mock.patch.object(dart_collector, "_fetch_dart_page", return_value={"list": []}) as m:
+            fetch_dart_for_days(3)
+        return m.call_args[0][0]
+
+    def test_cold_start_uses_full_window(self) -> None:
+        """상태 파일이 없으면 N일 전부터 조회."""
+        expected = (datetime.now().date() - timedelta(days=3)).strftime("%Y%m%d")
+        self.assertIsNone(load_dart_last_seen())
+        self.assertEqual(self._requested_bgn_de(), expected)
+
+    def test_last_seen_narrows_window(self) -> None:
+        """전송 완료 접수일이 N일 이내면 그 날짜부터 조회."""
+        today = datetime.now().date()
+        save_dart_last_seen([{"collectedAt": f"{today.isoformat()}T00:00:00"}])
+        self.assertEqual(self._requested_bgn_de(), today.strftime("%Y%m%d"))
+
+    def test_stale_last_seen_is_capped_to_window(self) -> None:
+        """오래된 접수일이어도 N일보다 넓게 조회하지 않음."""
+        save_dart_last_seen([{"collectedAt": "2000-01-01T00:00:00"}])
+        expected = (datetime.now().date() - timedelta(days=3)).strftime("%Y%m%d")
+        self.assertEqual(self._requested_bgn_de(), expected)
+
+    def test_save_keeps_latest_date(self) -> None:
+        """전송 항목 중 최신 접수일 저장, 더 이른 날짜로는 되돌리지 않음."""
+        save_dart_last_seen([
+            {"collectedAt": "2024-01-02T00:00:00"},
+            {"collectedAt": "2024-01-05T00:00:00"},
+        ])
+        save_dart_last_seen([{"collectedAt": "2024-01-03T00:00:00"}])
+        self.assertEqual(load_dart_last_seen(), date(2024, 1, 5))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+URL 중복 제거 키 단위 테스트.
+- 추적용 파라미터·fragment·스킴 차이는 같은 키, 기사 식별 쿼리는 다른 키로 구분되는지 검증.
+- 전송 완료 URL LRU(SeenUrls)의 한도·만료·저장/복원 검증.
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from collectors import dedup
+from collectors.dedup import SeenUrls, canonical_url, url_key
+
+
+class TestUrlKey(unittest.TestCase):
+    """정규화 및 해시 키 검증."""
+
+    def test_tracking_params_and_fragment_ignored(self) -> None:
+        """oc·utm_* 파라미터와 fragment는 키에 영향 없음."""
+        base = "https://news.google.com/rss/articles/CBMiabc"
+        self.assertEqual(url_key(base), url_key(base + "?oc=5"))
+        self.assertEqual(url_key(base), url_key(base + "?utm_source=x&utm_medium=rss#top"))
+
+    def test_scheme_and_host_case_ignored(self) -> None:
+        """http/https, 호스트 대소문자 차이는 같은 키."""
+        self.assertEqual(
+            url_key("http://Finance.Naver.com/news/a"),
+            url_key("https://finance.naver.com/news/a"),
+        )
+
+    def test_identifying_query_kept(self) -> None:
+        """네이버 article_id처럼 쿼리의 식별자가 다르면 다른 키."""
+        a = "https://finance.naver.com/news/news_read.naver?article_id=1&office_id=2"
+        b = "https://finance.naver.com/news/news_read.naver?article_id=3&office_id=2"
+        self.assertNotEqual(url_key(a), url_key(b))
+        self.assertEqual(canonical_url(a + "&utm_campaign=z"), "finance.naver.com/news/news_read.naver?article_id=1&office_id=2")
+
+    def test_key_is_64bit_int(self) -> None:
+        """키는 64비트 범위 정수."""
+        key = url_key("https://example.com/x")
+        self.assertIsInstance(key, int)
+        self.assertLess(key, 2 ** 64)
+
+
+class TestSeenUrls(unittest.TestCase):
+    """전송 완료 URL LRU 검증."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "seen.json"
+
+    def test_oldest_unused_key_is_evicted_over_max_size(self) -> None:
+        """한도 초과 시 가장 오래 조회되지 않은 키부터 제거."""
+        seen = SeenUrls(self.path, max_size=2)
+        seen.add(1)
+        seen.add(2)
+        self.assertIn(1, seen)  # 1 조회 → 2가 가장 오래된 키
+        seen.add(3)
+        self.assertEqual(len(seen), 2)
+        self.assertIn(1, seen)
+        self.assertNotIn(2, seen)
+
+    def test_expired_key_is_not_seen(self) -> None:
+        """ttl 경과 키는 미전송으로 취급."""
+        seen = SeenUrls(self.path, ttl=60)
+        with mock.patch.object(dedup.time, "time", return_value=1000.0):
+            seen.add(1)
+        with mock.patch.object(dedup.time, "time", return_value=1061.0):
+            self.assertNotIn(1, seen)
+
+    def test_save_and_load_round_trip(self) -> None:
+        """저장한 키는 새 인스턴스에서 복원, 손상 파일은 빈 상태로 시작."""
+        seen = SeenUrls(self.path)
+        seen.add(url_key("https://example.com/a"))
+        seen.save()
+        restored = SeenUrls(self.path)
+        restored.load()
+        self.assertIn(url_key("https://example.com/a"), restored)
+        self.path.write_text("not json", encoding="utf-8")
+        broken = SeenUrls(self.path)
+        broken.load()
+        self.assertEqual(len(broken), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+FileCache 단위 테스트.
+- 저장/조회 왕복, TTL 만료 시 None 반환 및 파일 삭제 검증.
+- sweep()이 다시 조회되지 않는 만료·손상 항목만 삭제하는지 검증.
+"""
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from collectors.file_cache import FileCache, atomic_write_text
+
+
+class TestFileCache(unittest.TestCase):
+    """TTL 캐시 동작 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_set_then_get_returns_data(self) -> None:
+        """TTL 이내 조회 시 저장한 값 그대로 반환."""
+        cache = FileCache(self.dir, ttl=60)
+        cache.set("20240101_20240103_1", {"list": [{"rcept_no": "1"}], "total_page": 3})
+        self.assertEqual(
+            cache.get("20240101_20240103_1"),
+            {"list": [{"rcept_no": "1"}], "total_page": 3},
+        )
+
+    def test_missing_key_returns_none(self) -> None:
+        """없는 키는 None."""
+        self.assertIsNone(FileCache(self.dir, ttl=60).get("nope"))
+
+    def test_expired_entry_returns_none_and_is_evicted(self) -> None:
+        """TTL 경과 시 None 반환, 캐시 파일 삭제."""
+        cache = FileCache(self.dir, ttl=60)
+        cache.set("k", [1, 2, 3], ttl=0.01)
+        time.sleep(0.05)
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(list(self.dir.glob("*.json")), [])
+
+    def test_corrupt_entry_returns_none(self) -> None:
+        """손상된 파일은 None 처리 후 삭제."""
+        cache = FileCache(self.dir, ttl=60)
+        atomic_write_text(self.dir / "bad.json", "{not json")
+        self.assertIsNone(cache.get("bad"))
+        self.assertFalse((self.dir / "bad.json").exists())
+
+    def test_unsafe_key_chars_are_sanitized(self) -> None:
+        """키의 경로 구분자 등은 파일명에서 치환되어 캐시 디렉터리 밖으로 나가지 않음."""
+        cache = FileCache(self.dir, ttl=60)
+        cache.set("../escape/key", "v")
+        self.assertEqual(cache.get("../escape/key"), "v")
+        self.assertEqual(len(list(self.dir.glob("*.json"))), 1)
+
+
+    def test_sweep_removes_only_expired_and_corrupt_entries(self) -> None:
+        """조회하지 않은 키도 만료·손상이면 sweep()에서 삭제, 유효 항목은 유지."""
+        cache = FileCache(self.dir, ttl=60)
+        cache.set("20240101_20240103_1", "old", ttl=0.01)
+        cache.set("20240102_20240104_1", "old", ttl=0.01)
+        cache.set("20240103_20240105_1", "live")
+        atomic_write_text(self.dir / "bad.json", "{not json")
+        time.sleep(0.05)
+        self.assertEqual(cache.sweep(), 3)
+        self.assertEqual([p.name for p in self.dir.glob("*.json")], ["20240103_20240105_1.json"])
+        self.assertEqual(cache.get("20240103_20240105_1"), "live")
+
+    def test_sweep_missing_directory(self) -> None:
+        """캐시 디렉터리가 아직 없으면 0."""
+        self.assertEqual(FileCache(self.dir / "none", ttl=60).sweep(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Google News collector 단위 테스트.
+- RSS 항목 파싱 결과(payload 형식, 시그널 키워드) 및 XML 오류 시 부분 결과 유지 검증.
+"""
+import unittest
+
+from collectors.google_news_collector import _parse_rss_items
+
+_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Google News</title>
+<item><title> Nvidia shares surge after earnings beat </title>
+<link>https://news.google.com/rss/articles/abc?oc=5</link>
+<pubDate>Tue, 01 Oct 2024 10:00:00 GMT</pubDate><source url="https://reuters.com">Reuters</source></item>
+<item><title>   </title><link>https://news.google.com/rss/articles/empty</link></item>
+<item><title>Quiet day for bonds</title><link>https://news.google.com/rss/articles/def</link>
+<pubDate>Tue, 01 Oct 2024 11:30:00 GMT</pubDate></item>
+</channel></rss>""".encode("utf-8")
+
+
+class TestGoogleNewsRssParsing(unittest.TestCase):
+    """RSS 파싱 및 payload 검증."""
+
+    def test_items_parsed_with_payload_shape(self) -> None:
+        """빈 제목 항목은 제외, 제목 trim, source/eventType/summary 구성."""
+        items = _parse_rss_items(_RSS, "stock market", "US")
+        self.assertEqual(len(items), 2)
+        first = items[0]
+        self.assertEqual(first["title"], "Nvidia shares surge after earnings beat")
+        self.assertEqual(first["source"], "GOOGLE_NEWS:Reuters")
+        self.assertEqual(first["eventType"], "GOOGLE_STOCK_MARKET")
+        self.assertEqual(first["summary"], "Query: stock market")
+        self.assertEqual(first["collectedAt"], "2024-10-01T10:00:00")
+        self.assertTrue(first["signalRelevant"])
+        self.assertEqual(items[1]["source"], "GOOGLE_NEWS:Google News")
+        self.assertFalse(items[1]["signalRelevant"])
+
+    def test_malformed_xml_keeps_items_parsed_so_far(self) -> None:
+        """중간에 XML이 깨져도 그 전까지 파싱된 항목은 유지."""
+        broken = _RSS.split(b"<item><title>   ")[0] + b"<item><title>oops</item>"
+        items = _parse_rss_items(broken, "nasdaq", "US")
+        self.assertEqual([it["title"] for it in items], ["Nvidia shares surge after earnings beat"])
+
+
+if __name__ == "__main__":
+    unittest.main()
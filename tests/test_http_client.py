@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+공통 HTTP 클라이언트 단위 테스트.
+- 429/502/503 응답 시 GET 재시도(Retry-After·백오프) 및 최대 재시도 후 마지막 응답 반환 검증.
+- RateLimiter 요청 시점 간격 검증.
+- asyncio 버전(aget_with_retry) 재시도 검증.
+"""
+import asyncio
+import unittest
+from typing import List
+from unittest import mock
+
+import httpx
+
+from collectors import http_client
+from collectors.http_client import RETRY_TOTAL, RateLimiter, aget_with_retry, get_with_retry
+
+
+def _client(statuses: List[int], calls: List[str]) -> httpx.Client:
+    """statuses 순서대로 응답하는 목 트랜스포트 클라이언트 (마지막 상태는 반복)."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        headers = {"Retry-After": "2"} if status == 429 else {}
+        return httpx.Response(status, headers=headers, content=b"{}")
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestGetWithRetry(unittest.TestCase):
+    """상태 코드 기반 GET 재시도 검증."""
+
+    def test_retries_retryable_status_then_succeeds(self) -> None:
+        """503 → 429 → 200이면 3번 호출, 백오프·Retry-After 만큼 대기."""
+        calls: List[str] = []
+        with mock.patch.object(http_client.time, "sleep") as sleep:
+            resp = get_with_retry(_client([503, 429, 200], calls), "https://example.com/a")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 2.0])
+
+    def test_non_retryable_status_returned_immediately(self) -> None:
+        """404 등은 재시도 없이 그대로 반환."""
+        calls: List[str] = []
+        with mock.patch.object(http_client.time, "sleep") as sleep:
+            resp = get_with_retry(_client([404], calls), "https://example.com/b")
+        self.assertEqual(resp.status_code, 404)
+        self.assertEqual(len(calls), 1)
+        sleep.assert_not_called()
+
+    def test_gives_up_after_retry_total(self) -> None:
+        """계속 503이면 RETRY_TOTAL회 재시도 후 마지막 503 응답 반환."""
+        calls: List[str] = []
+        with mock.patch.object(http_client.time, "sleep"):
+            resp = get_with_retry(_client([503], calls), "https://example.com/c")
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(len(calls), RETRY_TOTAL + 1)
+
+
+class TestAsyncGetWithRetry(unittest.TestCase):
+    """AsyncClient 재시도 검증."""
+
+    def test_retries_then_succeeds(self) -> None:
+        """502 → 200이면 2번 호출."""
+        calls: List[str] = []
+        statuses = [502, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            return httpx.Response(statuses[len(calls) - 1])
+
+        async def run() -> httpx.Response:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                with mock.patch.object(http_client.asyncio, "sleep", mock.AsyncMock()):
+                    return await aget_with_retry(client, "https://example.com/d")
+
+        self.assertEqual(asyncio.run(run()).status_code, 200)
+        self.assertEqual(len(calls), 2)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """초당 요청 수 상한 검증."""
+
+    def test_consecutive_calls_are_spaced_by_interval(self) -> None:
+        """같은 시각에 3번 호출하면 0, 0.5, 1.0초 뒤 시점으로 배정."""
+        limiter = RateLimiter(2)
+        with mock.patch.object(http_client.time, "monotonic", return_value=100.0), \
+                mock.patch.object(http_client.time, "sleep") as sleep:
+            for _ in range(3):
+                limiter.wait()
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 1.0])
+
+    def test_idle_limiter_does_not_wait(self) -> None:
+        """간격 이상 쉬었다가 호출하면 대기 없음."""
+        limiter = RateLimiter(2)
+        with mock.patch.object(http_client.time, "sleep") as sleep:
+            with mock.patch.object(http_client.time, "monotonic", return_value=100.0):
+                limiter.wait()
+            with mock.patch.object(http_client.time, "monotonic", return_value=101.0):
+                limiter.wait()
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
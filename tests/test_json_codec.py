@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+JSON 코덱 단위 테스트.
+- iter_items_payload 조각을 이어 붙인 본문이 {"items": [...]} JSON과 같은지 검증.
+"""
+import unittest
+
+import httpx
+
+from collectors import json_codec
+from collectors.json_codec import iter_items_payload
+
+
+class TestItemsPayload(unittest.TestCase):
+    """스트리밍 전송 본문 검증."""
+
+    def test_chunks_join_to_items_json(self) -> None:
+        """항목 수가 조각 크기의 배수가 아니어도 유효한 JSON, 항목 순서 유지."""
+        items = [{"title": f"제목{i}", "n": i} for i in range(7)]
+        chunks = list(iter_items_payload(items, chunk_items=3))
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(json_codec.loads(b"".join(chunks)), {"items": items})
+
+    def test_empty_items(self) -> None:
+        self.assertEqual(b"".join(iter_items_payload([])), b'{"items":[]}')
+
+    def test_sent_as_chunked_body(self) -> None:
+        """httpx content=로 넘기면 chunked 전송, 수신 측 본문은 동일 JSON."""
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["te"] = request.headers.get("Transfer-Encoding")
+            seen["body"] = json_codec.loads(request.read())
+            return httpx.Response(200)
+
+        items = [{"title": "a"}, {"title": "b"}]
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            client.post("https://example.com/api", content=iter_items_payload(items))
+        self.assertEqual(seen, {"te": "chunked", "body": {"items": items}})
+
+
+if __name__ == "__main__":
+    unittest.main()
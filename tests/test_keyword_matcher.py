@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+KeywordMatcher 단위 테스트.
+- Aho-Corasick/정규식 두 백엔드에서 동일한 부분 문자열 매칭 결과 검증.
+"""
+import unittest
+from unittest import mock
+
+from collectors import keyword_matcher
+from collectors.keyword_matcher import KeywordMatcher
+
+
+class _MatcherCases:
+    """백엔드 공통 케이스. 서브클래스에서 _make로 매처 생성."""
+
+    def _make(self, keywords, ignore_case=False) -> KeywordMatcher:
+        raise NotImplementedError
+
+    def test_substring_match(self) -> None:
+        """키워드가 부분 문자열로 포함되면 True."""
+        m = self._make(["무상증자", "감자"])
+        self.assertTrue(m.matches("주요사항보고서(무상증자결정)"))
+        self.assertTrue(m.matches("감자(감소)에 관한 사항"))
+        self.assertFalse(m.matches("정기보고서"))
+
+    def test_empty_or_non_string_is_false(self) -> None:
+        """None·빈 문자열·비문자열은 False."""
+        m = self._make(["배당"])
+        self.assertFalse(m.matches(None))
+        self.assertFalse(m.matches(""))
+        self.assertFalse(m.matches(123))  # type: ignore[arg-type]
+
+    def test_ignore_case(self) -> None:
+        """ignore_case=True면 대소문자 무시 (키워드·본문 모두 소문자 비교)."""
+        m = self._make(["Federal Reserve", "nvidia"], ignore_case=True)
+        self.assertTrue(m.matches("NVIDIA beats estimates"))
+        self.assertTrue(m.matches("the federal reserve holds rates"))
+        self.assertFalse(m.matches("Oil prices fall"))
+
+    def test_no_keywords_never_matches(self) -> None:
+        """키워드가 없으면 항상 False."""
+        self.assertFalse(self._make([]).matches("anything"))
+
+
+@unittest.skipIf(keyword_matcher.ahocorasick is None, "pyahocorasick 미설치")
+class TestKeywordMatcherAhoCorasick(_MatcherCases, unittest.TestCase):
+    def _make(self, keywords, ignore_case=False) -> KeywordMatcher:
+        return KeywordMatcher(keywords, ignore_case=ignore_case)
+
+
+class TestKeywordMatcherRegexFallback(_MatcherCases, unittest.TestCase):
+    def _make(self, keywords, ignore_case=False) -> KeywordMatcher:
+        with mock.patch.object(keyword_matcher, "ahocorasick", None):
+            return KeywordMatcher(keywords, ignore_case=ignore_case)
+
+
+if __name__ == "__main__":
+    unittest.main()
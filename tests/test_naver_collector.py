@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Naver collector 단위 테스트.
+- 페이지 원본 바이트(EUC-KR)를 디코딩 없이 파싱해 제목·URL·시그널 키워드를 추출하는지 검증.
+- 페이지 요청 간격(RateLimiter)이 페이지 사이에만 적용되는지 검증.
+"""
+import unittest
+from typing import List
+from unittest import mock
+
+import httpx
+
+from collectors import http_client, naver_collector
+from collectors.naver_collector import _parse_news_simple
+
+_PAGE = """<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr"></head>
+<body><ul class="newsList">
+<li><a href="/news/news_read.naver?article_id=1&amp;office_id=2">삼성전자 주가 급등 마감</a></li>
+<li><a href="news_read.naver?article_id=3"><strong>코스피</strong> 보합권 등락</a></li>
+<li><a href="https://n.news.naver.com/article/4">  외국인 순매수 지속   전망 </a></li>
+<li><a href="/news/x"><img src="thumb.jpg"></a></li>
+<li><a href="/news/dup">삼성전자 주가 급등 마감</a></li>
+<li><a href="/item/main.naver">뉴스 아닌 링크 제목</a></li>
+</ul></body></html>""".encode("euc-kr")
+
+
+class TestNaverNewsParsing(unittest.TestCase):
+    """EUC-KR 바이트 입력 파싱 검증."""
+
+    def test_parses_euc_kr_bytes_without_decoding(self) -> None:
+        """href에 news가 있는 앵커만, 중복 제목 제외, 상대경로는 절대 URL로 변환."""
+        items = _parse_news_simple(_PAGE, "시장뉴스")
+        self.assertEqual(
+            [it["title"] for it in items],
+            ["삼성전자 주가 급등 마감", "코스피 보합권 등락", "외국인 순매수 지속 전망"],
+        )
+        self.assertEqual(
+            [it["url"] for it in items],
+            [
+                "https://finance.naver.com/news/news_read.naver?article_id=1&office_id=2",
+                "https://finance.naver.com/news/news_read.naver?article_id=3",
+                "https://n.news.naver.com/article/4",
+            ],
+        )
+
+    def test_signal_keyword_and_payload_fields(self) -> None:
+        """시그널 키워드(급등·코스피) 매칭 및 고정 필드 구성."""
+        items = _parse_news_simple(_PAGE, "시장뉴스")
+        self.assertEqual([it["signalRelevant"] for it in items], [True, True, False])
+        self.assertEqual(items[0]["source"], "NAVER_FINANCE")
+        self.assertEqual(items[0]["itemType"], "BUZZ")
+        self.assertEqual(items[0]["eventType"], "NAVER_시장뉴스")
+
+    def test_empty_document_returns_no_items(self) -> None:
+        """빈 응답은 빈 목록."""
+        self.assertEqual(_parse_news_simple(b"", "시장뉴스"), [])
+
+
+class TestNaverFetch(unittest.TestCase):
+    """페이지 조회 간격 검증."""
+
+    def test_waits_only_between_pages(self) -> None:
+        """페이지 2개면 간격 대기 1회 (마지막 페이지 뒤 대기 없음), 페이지 간 중복 URL 제외."""
+        requests: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(str(request.url))
+            return httpx.Response(200, content=_PAGE)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(client.close)
+        with mock.patch.object(naver_collector, "_CLIENT", client), \
+                mock.patch.object(naver_collector, "_RATE_LIMITER", http_client.RateLimiter(0.5)), \
+                mock.patch.object(naver_collector, "_SEEN_URLS", set()), \
+                mock.patch.object(http_client.time, "sleep") as sleep:
+            items = naver_collector.fetch_naver_news()
+        self.assertEqual(len(requests), len(naver_collector.NAVER_NEWS_URLS))
+        self.assertEqual(sleep.call_count, len(requests) - 1)
+        self.assertEqual(len(items), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+SEC EDGAR collector 단위 테스트.
+- CIK별 동시 조회 결과가 CIK 목록 순서대로 합쳐지는지 검증.
+- submissions 응답에서 기준일 이후 제출 건만 payload로 변환하는지 검증.
+- ETag 조건부 GET(304 건너뜀)과 전송 성공 후 검증값 저장 검증.
+"""
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import mock
+
+import httpx
+
+from collectors import json_codec, sec_edgar_collector
+from collectors.sec_edgar_collector import (
+    _parse_filing_date,
+    _submissions_to_items,
+    fetch_sec_recent_filings,
+    fetch_submissions_for_cik,
+    load_sec_validators,
+    save_sec_validators,
+)
+
+_SUBMISSIONS = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "filings": {
+        "recent": {
+            "accessionNumber": ["0000320193-24-000003", "0000320193-24-000002", "0000320193-24-000001"],
+            "form": ["8-K", "10-Q", "4"],
+            "filingDate": ["2024-03-05", "2024-03-01", "2024-02-20"],
+            "primaryDocument": ["a8k.htm", "", "form4.xml"],
+        }
+    },
+}
+
+
+class TestSecConcurrentFetch(unittest.TestCase):
+    """CIK 동시 조회 검증."""
+
+    def test_results_follow_cik_order(self) -> None:
+        """앞 CIK 응답이 늦어도 결과는 CIK 순서 유지."""
+        ciks = ["0000000001", "0000000002", "0000000003"]
+
+        async def fake(_client, _base: str, _key: str, cik: str, _since: datetime, _ua: str, **_kw) -> List[Dict[str, Any]]:
+            if cik == ciks[0]:
+                await asyncio.sleep(0.05)
+            return [{"title": cik}]
+
+        with mock.patch.object(sec_edgar_collector, "resolve_sec_ciks", mock.AsyncMock(return_value=ciks)), \
+                mock.patch.object(sec_edgar_collector, "fetch_submissions_for_cik", side_effect=fake):
+            items, _validators = asyncio.run(fetch_sec_recent_filings(7))
+        self.assertEqual([it["title"] for it in items], ciks)
+
+
+class TestSecSubmissions(unittest.TestCase):
+    """submissions JSON → collected-news payload 변환 검증."""
+
+    def _fetch(self, since: datetime) -> List[Dict[str, Any]]:
+        return _submissions_to_items(_SUBMISSIONS, "0000320193", since)
+
+    def test_only_filings_since_cutoff(self) -> None:
+        """기준일 이전 제출 건 제외, 8-K는 signalRelevant·eventType 8K."""
+        items = self._fetch(datetime(2024, 3, 1))
+        self.assertEqual([it["eventType"] for it in items], ["8K", "10-Q"])
+        first = items[0]
+        self.assertTrue(first["signalRelevant"])
+        self.assertEqual(first["title"], "Apple Inc. - 8-K (2024-03-05)")
+        self.assertEqual(first["collectedAt"], "2024-03-05T00:00:00")
+        self.assertEqual(first["url"], "https://www.sec.gov/Archives/edgar/data/320193/000032019324000003/a8k.htm")
+        self.assertEqual(items[1]["url"], "https://www.sec.gov/Archives/edgar/data/320193/000032019324000002/000032019324000002.htm")
+        self.assertFalse(items[1]["signalRelevant"])
+
+    def test_scan_stops_at_first_filing_before_cutoff(self) -> None:
+        """최신순 배열 전제: 기준일 이전 항목 이후는 보지 않음."""
+        with mock.patch.dict(_SUBMISSIONS["filings"]["recent"], {
+            "filingDate": ["2024-03-05", "2024-02-01", "2024-03-03"],
+        }):
+            items = self._fetch(datetime(2024, 3, 1))
+        self.assertEqual([it["eventType"] for it in items], ["8K"])
+
+    def test_short_parallel_arrays_padded(self) -> None:
+        """form·primaryDocument 배열이 짧아도 accessionNumber 행 수만큼 처리."""
+        with mock.patch.dict(_SUBMISSIONS["filings"]["recent"], {"form": ["8-K"], "primaryDocument": []}):
+            items = self._fetch(datetime(2024, 3, 1))
+        self.assertEqual([it["eventType"] for it in items], ["8K", ""])
+        self.assertEqual(items[0]["url"], "https://www.sec.gov/Archives/edgar/data/320193/000032019324000003/000032019324000003.htm")
+        self.assertEqual(items[1]["title"], "0000320193-24-000002")
+
+    def test_parse_filing_date_fallback(self) -> None:
+        """형식이 잘못된 filingDate는 전달받은 now_iso."""
+        self.assertEqual(_parse_filing_date("2024-03-05"), "2024-03-05T00:00:00")
+        self.assertEqual(_parse_filing_date("2024-3-5", "NOW"), "NOW")
+        self.assertEqual(_parse_filing_date(None, "NOW"), "NOW")
+
+
+class TestSecCikList(unittest.TestCase):
+    """SEC_CIKS 고정 목록 정규화 검증."""
+
+    def test_ciks_padded_and_deduplicated(self) -> None:
+        with mock.patch.object(sec_edgar_collector, "SEC_CIKS_STR", "320193, 0000320193,789019,abc,"):
+            ciks = asyncio.run(sec_edgar_collector.resolve_sec_ciks(mock.Mock()))
+        self.assertEqual(ciks, ["0000320193", "0000789019"])
+
+
+class TestSecConditionalGet(unittest.TestCase):
+    """submissions ETag/Last-Modified 캐시 검증."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(sec_edgar_collector, "SEC_VALIDATORS_DB", Path(tmp.name) / "sec.sqlite3")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.requests: List[httpx.Request] = []
+
+    def _handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"', "Last-Modified": "Tue, 05 Mar 2024 10:00:00 GMT"},
+            content=json_codec.dumps(_SUBMISSIONS),
+        )
+
+    def _fetch(self, validators: Dict, pending: Dict, cik: str = "0000320193") -> List[Dict[str, Any]]:
+        async def run() -> List[Dict[str, Any]]:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(self._handler)) as client:
+                return await fetch_submissions_for_cik(
+                    client, "https://data.sec.gov", "", cik, datetime(2024, 3, 1), "ua",
+                    validators=validators, pending=pending,
+                )
+
+        return asyncio.run(run())
+
+    def test_validators_saved_only_after_forward_then_304_skips(self) -> None:
+        """200 검증값은 save_sec_validators 전까지 미저장, 저장 후 조건부 요청은 304 → 빈 목록."""
+        pending: Dict = {}
+        self.assertEqual(len(self._fetch({}, pending)), 2)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        self.assertEqual(load_sec_validators(), {})
+
+        save_sec_validators(pending)
+        validators = load_sec_validators()
+        self.assertEqual(validators, {"0000320193": ('"v1"', "Tue, 05 Mar 2024 10:00:00 GMT")})
+
+        second_pending: Dict = {}
+        self.assertEqual(self._fetch(validators, second_pending), [])
+        self.assertEqual(self.requests[1].headers["If-Modified-Since"], "Tue, 05 Mar 2024 10:00:00 GMT")
+        self.assertEqual(second_pending, {})
+
+    def test_overlapping_runs_keep_validators_separate(self) -> None:
+        """동시 실행 중 전송 실패한 실행의 검증값은 다른 실행의 저장에 섞이지 않음."""
+        def new_client(**_kwargs: Any) -> httpx.AsyncClient:
+            return httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+
+        async def run_both():
+            return await asyncio.gather(fetch_sec_recent_filings(7), fetch_sec_recent_filings(7))
+
+        resolve = mock.AsyncMock(side_effect=[["0000000001"], ["0000000002"]])
+        with mock.patch.object(sec_edgar_collector, "resolve_sec_ciks", resolve), \
+                mock.patch.object(sec_edgar_collector.http_client, "new_async_client", new_client):
+            (_unposted_items, unposted), (_posted_items, posted) = asyncio.run(run_both())
+
+        self.assertEqual(set(unposted), {"0000000001"})
+        save_sec_validators(posted)
+        self.assertEqual(set(load_sec_validators()), {"0000000002"})
+
+
+if __name__ == "__main__":
+    unittest.main()
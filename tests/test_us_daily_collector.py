@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+US daily collector 단위 테스트.
+- yf.download(group_by='ticker') 결과 프레임에서 종목별 첫 유효 행을 응답 형식으로 변환하는지 검증.
+- yf.download는 목으로 대체 (네트워크 미사용).
+"""
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from collectors import us_daily_collector
+from collectors.us_daily_collector import fetch_us_daily
+
+_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _download_frame(data: dict) -> pd.DataFrame:
+    """{symbol: [행, ...]} → 종목·필드 2단 컬럼 DataFrame (yf.download group_by='ticker' 형식)."""
+    index = pd.to_datetime(["2024-01-02", "2024-01-03"])
+    columns = pd.MultiIndex.from_product([list(data), _FIELDS])
+    values = np.hstack([np.array(rows, dtype=float) for rows in data.values()])
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+class TestFetchUsDaily(unittest.TestCase):
+    """일괄 조회 결과 변환 검증."""
+
+    def _fetch(self, frame: pd.DataFrame, symbols):
+        yf = mock.MagicMock()
+        yf.download.return_value = frame
+        with mock.patch.object(us_daily_collector, "yf", yf), \
+                mock.patch.object(us_daily_collector, "_HAS_YF", True):
+            return fetch_us_daily("2024-01-02", symbols), yf
+
+    def test_rows_built_per_symbol_in_request_order(self) -> None:
+        """종목별 첫 행, OHLC 소수 4자리 반올림, trdVal = volume * close."""
+        frame = _download_frame({
+            "AAPL": [[1.123456, 2.0, 0.5, 1.5, 1000], [9, 9, 9, 9, 9]],
+            "SPY": [[10.0, 11.0, 9.0, 10.5, 20], [9, 9, 9, 9, 9]],
+        })
+        rows, yf = self._fetch(frame, ["SPY", "AAPL", "SPY"])
+        self.assertEqual(yf.download.call_count, 1)
+        self.assertEqual(rows, [
+            {"symbol": "SPY", "open": 10.0, "high": 11.0, "low": 9.0, "close": 10.5, "volume": 20, "trdVal": 210},
+            {"symbol": "AAPL", "open": 1.1235, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 1000, "trdVal": 1500},
+        ])
+        for value in rows[0].values():
+            self.assertIn(type(value), (str, int, float))
+
+    def test_nan_close_row_skipped_and_missing_symbol_omitted(self) -> None:
+        """Close가 NaN인 행은 건너뛰고, 응답에 없는 종목·전부 NaN인 종목은 제외. NaN OHLC는 None."""
+        nan = float("nan")
+        frame = _download_frame({
+            "AAPL": [[nan, nan, nan, nan, nan], [nan, 3.0, 1.0, 2.0, nan]],
+            "MSFT": [[nan, nan, nan, nan, nan], [nan, nan, nan, nan, nan]],
+        })
+        rows, _yf = self._fetch(frame, ["AAPL", "MSFT", "NVDA"])
+        self.assertEqual(rows, [
+            {"symbol": "AAPL", "open": None, "high": 3.0, "low": 1.0, "close": 2.0, "volume": 0, "trdVal": 0},
+        ])
+
+    def test_single_level_columns_for_single_symbol(self) -> None:
+        """단일 종목 결과(단일 레벨 컬럼)도 같은 형식으로 변환."""
+        frame = _download_frame({"QQQ": [[1.0, 2.0, 0.5, 1.5, 10], [9, 9, 9, 9, 9]]})
+        frame.columns = frame.columns.droplevel(0)
+        rows, _yf = self._fetch(frame, ["QQQ"])
+        self.assertEqual(rows, [
+            {"symbol": "QQQ", "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10, "trdVal": 15},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+연합뉴스 collector 단위 테스트.
+- RSS 항목 파싱 결과(payload 형식, 시그널 키워드, 날짜 변환, 깨진 항목 건너뜀) 검증.
+"""
+import unittest
+
+from collectors.yonhap_collector import _parse_rss_date, _parse_rss_items
+
+_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>연합뉴스 경제</title>
+<item><title> 삼성전자 영업이익 시장 전망 상회 </title>
+<link>https://www.yna.co.kr/view/AKR1</link>
+<description> 반도체 업황 회복 </description>
+<pubDate>Tue, 01 Oct 2024 10:00:00 +0900</pubDate></item>
+<item><title>  </title><link>https://www.yna.co.kr/view/AKR2</link></item>
+<item><title>주말 날씨 맑음</title><link>https://www.yna.co.kr/view/AKR3</link>
+<description>전국 대체로 맑고 기준금리 동결 이후 첫 주말</description>
+<pubDate>Tue, 01 Oct 2024 11:30:00 +0900</pubDate></item>
+<item><title>지역 축제 개막</title><link>https://www.yna.co.kr/view/AKR4</link>
+<pubDate>not a date</pubDate></item>
+</channel></rss>""".encode("utf-8")
+
+
+class TestYonhapRssParsing(unittest.TestCase):
+    """RSS 파싱 및 payload 검증."""
+
+    def test_items_parsed_with_payload_shape(self) -> None:
+        """빈 제목 항목 제외, 제목·요약 trim, 카테고리별 eventType."""
+        items = _parse_rss_items(_RSS, "경제")
+        self.assertEqual(len(items), 3)
+        first = items[0]
+        self.assertEqual(first["title"], "삼성전자 영업이익 시장 전망 상회")
+        self.assertEqual(first["summary"], "반도체 업황 회복")
+        self.assertEqual(first["url"], "https://www.yna.co.kr/view/AKR1")
+        self.assertEqual(first["collectedAt"], "2024-10-01T10:00:00")
+        self.assertEqual(first["eventType"], "YONHAP_경제")
+        self.assertEqual(first["source"], "YONHAP")
+        self.assertIsNone(items[2]["summary"])
+
+    def test_signal_keyword_in_title_or_description(self) -> None:
+        """제목 또는 설명에 시그널 키워드가 있으면 signalRelevant."""
+        items = _parse_rss_items(_RSS, "경제")
+        self.assertEqual([it["signalRelevant"] for it in items], [True, True, False])
+
+    def test_invalid_pub_date_falls_back_to_now(self) -> None:
+        """pubDate 형식 오류 시 현재 시각(ISO)."""
+        items = _parse_rss_items(_RSS, "경제")
+        self.assertRegex(items[2]["collectedAt"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$")
+
+    def test_euc_kr_declared_feed_parsed_from_bytes(self) -> None:
+        """XML 선언 인코딩(EUC-KR) 바이트도 디코딩 없이 파싱."""
+        xml = _RSS.decode("utf-8").replace('encoding="UTF-8"', 'encoding="EUC-KR"').encode("euc-kr")
+        def key(items):
+            return [(it["title"], it["summary"], it["signalRelevant"]) for it in items]
+        self.assertEqual(key(_parse_rss_items(xml, "경제")), key(_parse_rss_items(_RSS, "경제")))
+
+    def test_broken_item_skipped_others_kept(self) -> None:
+        """<item> 블록 단위 파싱: 깨진 항목·잘린 문서 꼬리만 잃고 나머지는 유지, <item> 없으면 빈 목록."""
+        xml = _RSS.replace("<title>주말".encode("utf-8"), "<title><b>주말".encode("utf-8"))
+        xml = xml[: xml.rindex(b"</item>")]
+        items = _parse_rss_items(xml, "경제")
+        self.assertEqual([it["title"] for it in items], ["삼성전자 영업이익 시장 전망 상회"])
+        self.assertEqual(_parse_rss_items(b"<rss><channel><title>x</title></channel></rss>", "경제"), [])
+
+    def test_parse_rss_date_keeps_feed_local_time(self) -> None:
+        """타임존 변환 없이 피드 표기 시각, 2자리 연도 보정, 잘못된 값은 now_iso."""
+        self.assertEqual(_parse_rss_date("Tue, 01 Oct 2024 23:59:59 -0500"), "2024-10-01T23:59:59")
+        self.assertEqual(_parse_rss_date("01 Oct 24 09:05 GMT"), "2024-10-01T09:05:00")
+        self.assertEqual(_parse_rss_date("Tue, 01 Foo 2024", "NOW"), "NOW")
+        self.assertEqual(_parse_rss_date("", "NOW"), "NOW")
+
+
+if __name__ == "__main__":
+    unittest.main()